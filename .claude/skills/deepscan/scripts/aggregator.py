@@ -20,13 +20,91 @@ __all__ = [
     "has_final_marker",
 ]
 
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from itertools import chain
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from models import ChunkResult, Finding
 
+# Optional RapidFuzz import (C++ edit-distance ratio, falls back to difflib)
+try:
+    from rapidfuzz import fuzz, process
+
+    _RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    _RAPIDFUZZ_AVAILABLE = False
+
+# Optional python-Levenshtein import (C extension ratio, used when RapidFuzz is absent)
+try:
+    import Levenshtein
+
+    _LEVENSHTEIN_AVAILABLE = True
+except ImportError:
+    _LEVENSHTEIN_AVAILABLE = False
+
+# Optional datasketch import (MinHash-LSH blocking for large finding counts)
+try:
+    from datasketch import MinHash, MinHashLSH
+
+    _DATASKETCH_AVAILABLE = True
+except ImportError:
+    _DATASKETCH_AVAILABLE = False
+
+# Below this many findings the first-5-word token index is cheaper than MinHash setup
+_MINHASH_MIN_FINDINGS = 1000
+_MINHASH_NUM_PERM = 64
+
+# Optional pyahocorasick import (multi-pattern deleted-path matching)
+try:
+    import ahocorasick
+
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+# Up to this many deleted paths, plain substring checks beat building an automaton
+_AHOCORASICK_MIN_PATHS = 8
+
+# Confidence level -> numeric score (higher is more confident)
+_CONFIDENCE_SCORES = {"high": 3, "medium": 2, "low": 1}
+
+# Negation markers for contradiction detection; bit k of a finding's
+# negation mask is set when _NEGATION_WORDS[k] occurs in its lowered text
+_NEGATION_WORDS = ("no ", "not ", "never ", "without ", "n't ")
+
+
+@dataclass(slots=True)
+class _FindingColumns:
+    """Ingested findings in column (struct-of-arrays) layout.
+
+    Row i of every column describes the same finding. Built incrementally by
+    ResultAggregator._ingest, so no per-finding dict or object is materialized;
+    memory per finding is one slot in each column list.
+    """
+
+    findings: list[Finding] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+    confidences: list[str] = field(default_factory=list)
+    # Numeric confidence (int8, see _confidence_score) for best-member selection
+    confidence_scores: array = field(default_factory=lambda: array("b"))
+    points: list[str] = field(default_factory=list)  # Cleaned point without prefix
+    points_lower: list[str] = field(default_factory=list)  # Lowered once for similarity checks
+    tokens: list[frozenset[str]] = field(default_factory=list)  # First 5 words (blocking)
+    verification: list[bool] = field(default_factory=list)
+    negation_masks: list[int] = field(default_factory=list)  # See _NEGATION_WORDS
+    # Inverted index: significant token -> row indices (updated per ingested finding)
+    token_index: dict[str, list[int]] = field(default_factory=lambda: defaultdict(list))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
 
 class ResultAggregator:
     """Aggregates findings from multiple chunks (REDUCE phase).
@@ -53,6 +131,9 @@ class ResultAggregator:
                 Default: 0.7 (REQ_02 FR-006)
         """
         self.similarity_threshold = similarity_threshold
+        # Pairwise similarity cache shared by grouping and contradiction phases.
+        # Keyed by canonically ordered text pair; values are (score, score_cutoff).
+        self._sim_cache: dict[tuple[str, str], tuple[float, float]] = {}
 
     def aggregate_findings(
         self,
@@ -78,41 +159,25 @@ class ResultAggregator:
             - needs_manual_review: True if contradictions exist
             - filtered_deleted_files: Count of findings filtered due to deleted files
         """
+        self._sim_cache = {}
+
         # Normalize deleted files paths (P7-003)
         deleted_set = self._normalize_deleted_paths(deleted_files)
+        contains_deleted = self._build_deleted_matcher(deleted_set) if deleted_set else None
         filtered_count = 0
 
         # Step 1: Collect all findings (with ghost filter)
-        all_findings = []
-        verification_count = 0
+        columns = _FindingColumns()
         for result in chunk_results:
             for finding in result.findings:
                 # P7-003: Filter findings from deleted files
-                if deleted_set and self._is_ghost_finding(finding, result.chunk_id, deleted_set):
+                if contains_deleted and self._is_ghost_finding(finding, result.chunk_id, contains_deleted):
                     filtered_count += 1
                     continue
 
-                # P3.3-FIX: Parse NEEDS_VERIFICATION prefix
-                # Issue 6 FIX: Handle prefix with or without colon (prompt/parser mismatch)
-                point = finding.point
-                needs_verification = finding.verification_required
-                if point.startswith("NEEDS_VERIFICATION"):
-                    needs_verification = True
-                    verification_count += 1
-                    # Remove prefix, handling optional colon and whitespace
-                    point = point[len("NEEDS_VERIFICATION"):].lstrip(": ").strip()
-
-                all_findings.append(
-                    {
-                        "finding": finding,
-                        "source_chunk": result.chunk_id,
-                        "confidence": finding.confidence,
-                        "point_clean": point,  # Cleaned point without prefix
-                        "verification_required": needs_verification,
-                    }
-                )
+                self._ingest(columns, finding, result.chunk_id)
 
-        if not all_findings:
+        if not columns:
             return {
                 "aggregated_findings": [],
                 "total_findings": 0,
@@ -126,40 +191,49 @@ class ResultAggregator:
             }
 
         # Step 2: Group by similarity
-        groups = self._group_by_similarity(all_findings)
+        groups = self._group_by_similarity(columns)
 
         # Step 3: Merge similar findings
         merged = []
+        merged_rows = []  # Parallel to merged: column row of each best member
+        confidence_scores = columns.confidence_scores
         for group in groups:
-            best = max(group, key=lambda x: self._confidence_score(x["confidence"]))
+            # Highest confidence wins; ties keep the earliest member
+            best = max(group, key=confidence_scores.__getitem__)
             # P3.3-FIX: Preserve verification_required flag (OR logic - if ANY needs it)
-            verification_required = any(f.get("verification_required", False) for f in group)
+            verification_required = any(columns.verification[k] for k in group)
             merged.append(
                 {
-                    "finding": best["finding"],
-                    "sources": [f["source_chunk"] for f in group],
+                    "finding": columns.findings[best],
+                    "sources": [columns.sources[k] for k in group],
                     "support_count": len(group),
-                    "confidence": best["confidence"],
+                    "confidence": columns.confidences[best],
                     "verification_required": verification_required,
                     # Issue 5 FIX: Store cleaned point to avoid redundant stripping
-                    "point_clean": best["point_clean"],
+                    "point_clean": columns.points[best],
                 }
             )
+            merged_rows.append(best)
 
-        # Step 4: Sort by relevance
-        merged.sort(key=lambda x: -self._relevance_score(x["finding"], original_query))
+        # Step 4: Sort by relevance (query tokenized once, one score per finding)
+        query_words = set(original_query.lower().split())
+        relevance = [self._relevance_score(m["finding"], query_words) for m in merged]
+        order = sorted(range(len(merged)), key=lambda k: -relevance[k])
+        merged = [merged[k] for k in order]
+        merged_rows = [merged_rows[k] for k in order]
 
         # Step 5: Detect contradictions
-        contradictions = self._detect_contradictions(merged)
+        contradictions = self._detect_contradictions(merged, merged_rows, columns)
+        self._sim_cache.clear()
 
         # P3.3-FIX: Separate verification-required findings for distinct display
         verification_findings = [f for f in merged if f.get("verification_required", False)]
 
         return {
             "aggregated_findings": merged,
-            "total_findings": len(all_findings),
+            "total_findings": len(columns),
             "unique_findings": len(merged),
-            "deduplication_ratio": 1 - (len(merged) / max(len(all_findings), 1)),
+            "deduplication_ratio": 1 - (len(merged) / max(len(columns), 1)),
             "contradictions": contradictions,
             "needs_manual_review": len(contradictions) > 0,
             "filtered_deleted_files": filtered_count,
@@ -167,6 +241,44 @@ class ResultAggregator:
             "verification_required_findings": verification_findings,  # P3.3-FIX
         }
 
+    def _ingest(self, columns: _FindingColumns, finding: Finding, chunk_id: str) -> None:
+        """Append one finding to the column store and update its token index.
+
+        Args:
+            columns: Column store being built for this aggregation call.
+            finding: Finding object to ingest.
+            chunk_id: Chunk the finding came from.
+        """
+        # P3.3-FIX: Parse NEEDS_VERIFICATION prefix
+        # Issue 6 FIX: Handle prefix with or without colon (prompt/parser mismatch)
+        point = finding.point
+        needs_verification = finding.verification_required
+        if point.startswith("NEEDS_VERIFICATION"):
+            needs_verification = True
+            # Remove prefix, handling optional colon and whitespace
+            point = point[len("NEEDS_VERIFICATION"):].lstrip(": ").strip()
+
+        row = len(columns)
+        point_lower = point.lower()
+        tokens = frozenset(point_lower.split()[:5])
+
+        columns.findings.append(finding)
+        columns.sources.append(chunk_id)
+        columns.confidences.append(finding.confidence)
+        columns.confidence_scores.append(self._confidence_score(finding.confidence))
+        columns.points.append(point)
+        columns.points_lower.append(point_lower)
+        columns.tokens.append(tokens)
+        columns.verification.append(needs_verification)
+        columns.negation_masks.append(
+            sum(1 << k for k, neg in enumerate(_NEGATION_WORDS) if neg in point_lower)
+        )
+
+        # Issue 2 FIX: Index point_clean tokens, not the raw prefixed point
+        for word in tokens:
+            if len(word) >= 3:  # Skip very short words (articles, etc.)
+                columns.token_index[word].append(row)
+
     def _normalize_deleted_paths(self, deleted_files: list[str] | None) -> set[str]:
         """Normalize deleted file paths for comparison.
 
@@ -195,11 +307,33 @@ class ResultAggregator:
         # Replace backslashes with forward slashes, lowercase
         return path.replace("\\", "/").lower()
 
+    def _build_deleted_matcher(self, deleted_paths: set[str]) -> Callable[[str], bool]:
+        """Build a predicate testing whether text contains any deleted path.
+
+        For more than _AHOCORASICK_MIN_PATHS paths (and pyahocorasick installed),
+        an Aho-Corasick automaton finds any hit in a single pass over the text
+        instead of one substring scan per deleted path.
+
+        Args:
+            deleted_paths: Set of normalized deleted file paths.
+
+        Returns:
+            Function mapping normalized text to True if any deleted path occurs in it.
+        """
+        if _AHOCORASICK_AVAILABLE and len(deleted_paths) > _AHOCORASICK_MIN_PATHS:
+            automaton = ahocorasick.Automaton()
+            for path in deleted_paths:
+                automaton.add_word(path, path)
+            automaton.make_automaton()
+            return lambda text: next(automaton.iter(text), None) is not None
+
+        return lambda text: any(deleted in text for deleted in deleted_paths)
+
     def _is_ghost_finding(
         self,
         finding: Finding,
         chunk_id: str,
-        deleted_paths: set[str],
+        contains_deleted: Callable[[str], bool],
     ) -> bool:
         """Check if a finding references a deleted file.
 
@@ -211,119 +345,250 @@ class ResultAggregator:
         Args:
             finding: Finding object to check.
             chunk_id: Chunk identifier (may contain file path).
-            deleted_paths: Set of normalized deleted file paths.
+            contains_deleted: Matcher from _build_deleted_matcher().
 
         Returns:
             True if finding references a deleted file.
         """
         # Check chunk_id
-        chunk_norm = self._normalize_path(chunk_id)
-        for deleted in deleted_paths:
-            if deleted in chunk_norm:
-                return True
+        if contains_deleted(self._normalize_path(chunk_id)):
+            return True
 
         # Check finding.location.file
-        if finding.location and "file" in finding.location:
-            loc_file = self._normalize_path(str(finding.location["file"]))
-            for deleted in deleted_paths:
-                if deleted in loc_file:
-                    return True
+        if (
+            finding.location
+            and "file" in finding.location
+            and contains_deleted(self._normalize_path(str(finding.location["file"])))
+        ):
+            return True
 
         # Check finding.evidence (may mention file path)
-        if finding.evidence:
-            evidence_norm = self._normalize_path(finding.evidence)
-            for deleted in deleted_paths:
-                if deleted in evidence_norm:
-                    return True
-
-        return False
+        return bool(finding.evidence and contains_deleted(self._normalize_path(finding.evidence)))
 
-    def _group_by_similarity(self, findings: list[dict]) -> list[list[dict]]:
+    def _group_by_similarity(self, columns: _FindingColumns) -> list[list[int]]:
         """Group findings by text similarity with token-based blocking optimization.
 
         Optimized algorithm:
-        1. Build inverted index by tokens (O(n))
-        2. For each finding, only compare against candidates sharing tokens
-        3. Apply quick filters (length ratio, token overlap) before expensive similarity
-        4. Use greedy grouping within candidate set
+        1. Use the token index built during ingest (O(n)); with datasketch installed and
+           at least _MINHASH_MIN_FINDINGS findings, use MinHash-LSH over the
+           full token set instead, which avoids collisions on common words
+        2. For each finding, only compare against candidates from the index whose
+           length falls inside the window where the threshold is reachable
+        3. Score each candidate block in a single RapidFuzz call; without RapidFuzz,
+           apply quick filters (length ratio, token overlap) before per-pair similarity
+        4. Union similar pairs and emit connected components as groups
+
+        Components are order-independent: a finding joins a group if it is
+        similar to any member, not only to the first finding seen.
 
         Complexity: O(n * k + b^2 * m) where k=avg tokens, b=avg block size, m=string length
         For diverse natural language, b << n, so effectively near-linear.
         Worst case (all findings share words): Still O(n^2) but rare for real data.
 
         Args:
-            findings: List of finding dicts with 'finding' key.
+            columns: Ingested findings.
 
         Returns:
-            List of groups (each group is a list of finding dicts).
+            List of groups (each group is a list of row indices, ascending).
         """
-        if len(findings) <= 1:
-            return [[f] for f in findings]
+        n = len(columns)
+        if n <= 1:
+            return [[i] for i in range(n)]
+
+        # Union-find over finding indices (path halving)
+        parent = list(range(n))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        # Exact duplicates join the first occurrence up front; only the first
+        # occurrence of each distinct text takes part in pairwise scoring
+        first_seen: dict[str, int] = {}
+        for i, text in enumerate(columns.points_lower):
+            parent[i] = first_seen.setdefault(text, i)
+        distinct = [parent[i] == i for i in range(n)]
+
+        # Blocking index - MinHash-LSH for large inputs, else ingest-time token index
+        use_lsh = _DATASKETCH_AVAILABLE and n >= _MINHASH_MIN_FINDINGS
+        if use_lsh:
+            lsh, minhashes = self._build_minhash_index(columns, distinct)
+        token_index = columns.token_index
+
+        # Length window: similarity is at most 2*min/(L + M) for lengths L and M
+        # (see _can_be_similar), so a partner of a length-L seed must satisfy
+        # t*L/(2-t) <= M <= L*(2-t)/t. Rank findings by length so the window is
+        # a contiguous rank range found by bisection, checked per pair with ints.
+        threshold = self.similarity_threshold
+        lengths = [len(text) for text in columns.points_lower]
+        by_length = sorted(range(n), key=lengths.__getitem__)
+        sorted_lengths = [lengths[k] for k in by_length]
+        rank = [0] * n
+        for position, k in enumerate(by_length):
+            rank[k] = position
+
+        for i in range(n):
+            if not distinct[i]:
+                continue
+            if threshold > 0:
+                length = lengths[i]
+                # Small epsilon keeps pairs sitting exactly on the bound
+                lo = bisect_left(sorted_lengths, threshold * length / (2 - threshold) - 1e-9)
+                hi = bisect_right(sorted_lengths, length * (2 - threshold) / threshold + 1e-9)
+            else:
+                lo, hi = 0, n
+            # Get candidate indices from the blocking index.
+            # Each pair is visited once (j > i); pairs already connected are skipped.
+            root = find(i)
+            if use_lsh:
+                blocked = lsh.query(minhashes[i])
+            else:
+                blocked = chain.from_iterable(
+                    token_index.get(word, ()) for word in columns.tokens[i] if len(word) >= 3
+                )
+            candidates = {
+                j for j in blocked if j > i and distinct[j] and lo <= rank[j] < hi and find(j) != root
+            }
 
-        groups = []
-        used = set()
+            for j in self._match_block(i, candidates, columns):
+                parent[find(j)] = root
 
-        # Build token index for blocking - O(n)
-        token_index = self._build_token_index(findings)
+        # Emit components in order of their first member
+        components: dict[int, list[int]] = {}
+        for i in range(n):
+            components.setdefault(find(i), []).append(i)
 
-        for i, f1 in enumerate(findings):
-            if i in used:
-                continue
+        return list(components.values())
 
-            group = [f1]
-            used.add(i)
-            # Issue 2 FIX: Use point_clean to exclude NEEDS_VERIFICATION prefix from similarity
-            text1 = f1["point_clean"]
-
-            # Get candidate indices from token index (only findings sharing tokens)
-            candidates = set()
-            words = text1.lower().split()[:5]
-            for word in words:
-                if len(word) >= 3:
-                    candidates.update(token_index.get(word, []))
-            candidates.discard(i)
-            candidates -= used
-
-            for j in candidates:
-                f2 = findings[j]
-                # Issue 2 FIX: Use point_clean for consistent deduplication
-                text2 = f2["point_clean"]
-
-                # Quick filter before expensive SequenceMatcher
-                if not self._can_be_similar(text1, text2):
-                    continue
+    def _match_block(self, seed: int, candidates: set[int], columns: _FindingColumns) -> list[int]:
+        """Return indices of candidates whose similarity to seed meets the threshold.
+
+        With RapidFuzz the whole block is scored in a single native call
+        instead of one Python-level similarity call per pair.
+
+        Args:
+            seed: Row index of the finding the candidates are compared against.
+            candidates: Row indices of findings sharing tokens with the seed.
+            columns: Ingested findings.
 
-                # Full similarity check
-                similarity = self._text_similarity(text1, text2)
-                if similarity >= self.similarity_threshold:
-                    group.append(f2)
-                    used.add(j)
+        Returns:
+            Sorted list of matching finding indices.
+        """
+        # Issue 2 FIX: Use point_clean to exclude NEEDS_VERIFICATION prefix from similarity
+        points_lower = columns.points_lower
+        text = points_lower[seed]
+        if _RAPIDFUZZ_AVAILABLE:
+            choices = {j: points_lower[j] for j in candidates}
+            matches = process.extract(
+                text,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=self.similarity_threshold * 100,
+                limit=None,
+            )
+            matched = sorted(key for _, _, key in matches)
+            # Record block scores for reuse by _detect_contradictions
+            scores = {key: score / 100.0 for _, score, key in matches}
+            for j, other in choices.items():
+                self._store_similarity(text, other, scores.get(j, 0.0), self.similarity_threshold)
+            return matched
+
+        matched = []
+        tokens = columns.tokens
+        for j in candidates:
+            # Issue 2 FIX: Use point_clean for consistent deduplication
+            other = points_lower[j]
+
+            # Quick filter before expensive similarity computation
+            if not self._can_be_similar(text, other, tokens[seed], tokens[j]):
+                continue
 
-            groups.append(group)
+            # Full similarity check
+            similarity = self._cached_similarity(text, other, score_cutoff=self.similarity_threshold)
+            if similarity >= self.similarity_threshold:
+                matched.append(j)
+        return sorted(matched)
 
-        return groups
+    def _cached_similarity(self, a: str, b: str, score_cutoff: float = 0.0) -> float:
+        """Return _text_similarity(a, b), reusing scores computed earlier in the call.
 
-    def _text_similarity(self, a: str, b: str) -> float:
-        """Calculate text similarity using SequenceMatcher.
+        A cached score is reused when it is exact (at or above the cutoff it was
+        computed with) or when its cutoff is no stricter than the requested one.
 
         Args:
-            a: First text.
-            b: Second text.
+            a: First text (lowercase).
+            b: Second text (lowercase).
+            score_cutoff: Same meaning as in _text_similarity.
 
         Returns:
             Similarity ratio (0.0 to 1.0).
         """
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        key = (a, b) if a <= b else (b, a)
+        cached = self._sim_cache.get(key)
+        if cached is not None:
+            score, cutoff = cached
+            if score >= cutoff or cutoff <= score_cutoff:
+                return score
+
+        score = self._text_similarity(a, b, score_cutoff=score_cutoff)
+        self._sim_cache[key] = (score, score_cutoff)
+        return score
+
+    def _store_similarity(self, a: str, b: str, score: float, score_cutoff: float) -> None:
+        """Record a similarity computed outside _cached_similarity (e.g. batch scoring).
+
+        Args:
+            a: First text (lowercase).
+            b: Second text (lowercase).
+            score: Similarity ratio, 0.0 if below score_cutoff.
+            score_cutoff: Cutoff the score was computed with.
+        """
+        self._sim_cache[(a, b) if a <= b else (b, a)] = (score, score_cutoff)
+
+    def _text_similarity(self, a: str, b: str, score_cutoff: float = 0.0) -> float:
+        """Calculate text similarity using the fastest available backend.
+
+        Order of preference: RapidFuzz, python-Levenshtein, difflib.SequenceMatcher.
+
+        Callers pass already-lowercased text (see ``point_lower``).
+
+        Args:
+            a: First text (lowercase).
+            b: Second text (lowercase).
+            score_cutoff: Scores below this bound may be reported as 0.0,
+                letting RapidFuzz stop early when the bound is unreachable.
 
-    def _can_be_similar(self, a: str, b: str) -> bool:
+        Returns:
+            Similarity ratio (0.0 to 1.0).
+        """
+        if _RAPIDFUZZ_AVAILABLE:
+            return fuzz.ratio(a, b, score_cutoff=score_cutoff * 100) / 100.0
+        if _LEVENSHTEIN_AVAILABLE:
+            return Levenshtein.ratio(a, b)
+
+        matcher = SequenceMatcher(None, a, b)
+        # real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio()
+        if score_cutoff and (
+            matcher.real_quick_ratio() < score_cutoff or matcher.quick_ratio() < score_cutoff
+        ):
+            return 0.0
+        return matcher.ratio()
+
+    def _can_be_similar(
+        self, a: str, b: str, tokens_a: frozenset[str], tokens_b: frozenset[str]
+    ) -> bool:
         """Quick check if two strings could possibly be similar.
 
-        Uses length ratio and token overlap as fast filters before
-        expensive SequenceMatcher computation.
+        Uses the length-derived similarity upper bound and token overlap as
+        fast filters before expensive similarity computation.
 
         Args:
-            a: First text.
-            b: Second text.
+            a: First text (lowercase).
+            b: Second text (lowercase).
+            tokens_a: First 5 words of a.
+            tokens_b: First 5 words of b.
 
         Returns:
             True if strings could be similar (needs full check),
@@ -333,43 +598,48 @@ class ResultAggregator:
         if len_a == 0 or len_b == 0:
             return len_a == len_b  # Both empty = similar
 
-        # Length ratio check - strings with very different lengths can't be similar
-        # Use 0.5 as absolute minimum (more lenient than similarity_threshold)
-        # because SequenceMatcher can still find high similarity with length differences
-        length_ratio = min(len_a, len_b) / max(len_a, len_b)
-        if length_ratio < 0.5:
+        # Length bound - both RapidFuzz and SequenceMatcher ratios are 2*M / (len_a + len_b)
+        # with M <= min(len_a, len_b) matched characters, so 2*min / (len_a + len_b) is an
+        # upper bound on similarity. If even that misses the threshold, skip the full check.
+        if 2 * min(len_a, len_b) / (len_a + len_b) < self.similarity_threshold:
             return False
 
         # Quick token overlap check - no shared words = definitely not similar
-        tokens_a = set(a.lower().split()[:5])
-        tokens_b = set(b.lower().split()[:5])
         if tokens_a and tokens_b and not (tokens_a & tokens_b):
             return False
 
         return True
 
-    def _build_token_index(self, findings: list[dict]) -> dict[str, list[int]]:
-        """Build inverted index of findings by significant tokens.
+    def _build_minhash_index(
+        self, columns: _FindingColumns, distinct: list[bool]
+    ) -> tuple[MinHashLSH, dict[int, MinHash]]:
+        """Build a MinHash-LSH index over the full word set of each distinct finding.
 
-        Enables token-based blocking for O(n) index build instead of O(n^2) comparisons.
+        LSH gives near-neighbor candidates in sub-linear expected time and does
+        not degrade when many findings share a common leading word. The LSH
+        Jaccard threshold is half the similarity threshold: word-set Jaccard
+        runs well below the character ratio for reworded findings, and exact
+        similarity is still checked on every candidate.
 
         Args:
-            findings: List of finding dicts with 'finding' key.
+            columns: Ingested findings.
+            distinct: Flags marking the first occurrence of each distinct text.
 
         Returns:
-            Dict mapping tokens to list of finding indices.
+            Tuple of (LSH index keyed by finding index, MinHash per indexed finding).
         """
-        token_index: dict[str, list[int]] = defaultdict(list)
+        lsh = MinHashLSH(threshold=self.similarity_threshold / 2, num_perm=_MINHASH_NUM_PERM)
+        minhashes: dict[int, MinHash] = {}
 
-        for i, f in enumerate(findings):
-            # Issue 2 FIX: Use point_clean for consistent token indexing
-            text = f["point_clean"].lower()
-            words = text.split()[:5]  # First 5 words
-            for word in words:
-                if len(word) >= 3:  # Skip very short words (articles, etc.)
-                    token_index[word].append(i)
+        for i, text in enumerate(columns.points_lower):
+            if not distinct[i]:
+                continue
+            minhash = MinHash(num_perm=_MINHASH_NUM_PERM)
+            minhash.update_batch([word.encode("utf-8") for word in set(text.split())])
+            lsh.insert(i, minhash)
+            minhashes[i] = minhash
 
-        return token_index
+        return lsh, minhashes
 
     def _confidence_score(self, confidence: str) -> int:
         """Convert confidence level to numeric score.
@@ -383,21 +653,20 @@ class ResultAggregator:
         # Normalize to lowercase for case-insensitive matching
         normalized = confidence.lower() if confidence else ""
         # Return 1 (low) for unknown values instead of 0 to avoid unexpected ordering
-        return {"high": 3, "medium": 2, "low": 1}.get(normalized, 1)
+        return _CONFIDENCE_SCORES.get(normalized, 1)
 
-    def _relevance_score(self, finding: Finding, query: str) -> float:
+    def _relevance_score(self, finding: Finding, query_words: set[str]) -> float:
         """Calculate relevance to original query.
 
         Uses simple keyword overlap scoring.
 
         Args:
             finding: Finding object.
-            query: Original query string.
+            query_words: Lowercased word set of the original query.
 
         Returns:
             Relevance score (0.0 to 1.0).
         """
-        query_words = set(query.lower().split())
         finding_words = set(finding.point.lower().split())
 
         if not query_words:
@@ -406,30 +675,52 @@ class ResultAggregator:
         overlap = len(query_words & finding_words)
         return overlap / len(query_words)
 
-    def _detect_contradictions(self, merged: list[dict]) -> list[dict]:
+    def _detect_contradictions(
+        self, merged: list[dict], rows: list[int], columns: _FindingColumns
+    ) -> list[dict]:
         """Detect contradictory findings with early termination optimization.
 
         Simple heuristic: looks for negation patterns in similar findings.
-        Optimized with length ratio filter to reduce SequenceMatcher calls.
+        Each finding's bitmask of contained negation words is computed at
+        ingest; only pairs in different mask buckets (one has a negation word
+        the other lacks) are considered, then a length ratio filter trims
+        similarity calls.
 
         Args:
             merged: List of merged finding dicts.
+            rows: Column row of each merged finding's best member (same order).
+            columns: Ingested findings.
 
         Returns:
             List of contradiction dicts with finding_1, finding_2, severity.
         """
         contradictions = []
-        negation_words = ["no ", "not ", "never ", "without ", "n't "]
         # Contradiction detection uses lower threshold than deduplication
         contradiction_similarity_threshold = 0.4
 
+        texts = [columns.points_lower[row] for row in rows]
+        masks = [columns.negation_masks[row] for row in rows]
+
+        # Bucket findings by negation mask; pairs within a bucket never differ
+        buckets: dict[int, list[int]] = defaultdict(list)
+        for i, mask in enumerate(masks):
+            buckets[mask].append(i)
+        if len(buckets) < 2:
+            return contradictions
+
         for i, f1 in enumerate(merged):
-            for j, f2 in enumerate(merged):
-                if i >= j:
-                    continue
+            # Candidates after i from every other bucket, in index order
+            partners = sorted(
+                j
+                for mask, indices in buckets.items()
+                if mask != masks[i]
+                for j in indices[bisect_right(indices, i):]
+            )
+            text1 = texts[i]
 
-                text1 = f1["finding"].point.lower()
-                text2 = f2["finding"].point.lower()
+            for j in partners:
+                f2 = merged[j]
+                text2 = texts[j]
 
                 # Early termination: length ratio filter
                 # If lengths are very different, texts can't be similar enough
@@ -438,22 +729,11 @@ class ResultAggregator:
                     if min(len1, len2) / max(len1, len2) < contradiction_similarity_threshold:
                         continue
 
-                # Check for negation patterns (bidirectional)
-                # One text has negation word, the other doesn't
-                has_negation_diff = False
-                for neg in negation_words:
-                    t1_has = neg in text1
-                    t2_has = neg in text2
-                    if t1_has != t2_has:  # XOR: one has it, other doesn't
-                        has_negation_diff = True
-                        break
-
-                # Skip expensive similarity check if no negation difference
-                if not has_negation_diff:
-                    continue
-
                 # Only flag if texts are somewhat similar (same topic)
-                if self._text_similarity(text1, text2) > contradiction_similarity_threshold:
+                similarity = self._cached_similarity(
+                    text1, text2, score_cutoff=contradiction_similarity_threshold
+                )
+                if similarity > contradiction_similarity_threshold:
                     contradictions.append(
                         {
                             "finding_1": f1["finding"].point,
@@ -548,10 +828,21 @@ def aggregate_chunk_results(
 
 import json
 import re
-from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+# Optional orjson import (faster FINAL payload parsing, falls back to json)
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# orjson reads integers outside the 64-bit range as floats instead of raising, so
+# payloads with a run of 19+ digits (a possible such integer) go to json instead.
+_WIDE_DIGITS_RE = re.compile(r"[0-9]{19}")
+
 
 class FinalMarkerType(Enum):
     """Types of termination markers."""
@@ -571,6 +862,54 @@ class ParsedFinalMarker:
     raw_match: str  # Original matched text
 
 
+# Pattern for each marker type, compiled once at import.
+# Uses non-greedy matching for content, handles nested parentheses for JSON
+_FINAL_PATTERNS: list[tuple[FinalMarkerType, re.Pattern[str]]] = [
+    (marker_type, re.compile(pattern, re.DOTALL | re.IGNORECASE))
+    for marker_type, pattern in (
+        (FinalMarkerType.FINAL, r"FINAL\s*\(\s*(\{.*?\}|\[.*?\]|\".*?\"|'.*?'|\d+|true|false|null)\s*\)"),
+        (FinalMarkerType.FINAL_VAR, r"FINAL_VAR\s*\(\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\)"),
+        (FinalMarkerType.NEEDS_MORE, r"NEEDS_MORE\s*\(\s*[\"'](.+?)[\"']\s*\)"),
+        (FinalMarkerType.UNABLE, r"UNABLE\s*\(\s*[\"'](.+?)[\"']\s*\)"),
+    )
+]
+
+# Necessary condition for every marker: keyword followed by "(".
+# Lets marker-free responses skip the four per-type passes.
+_FINAL_MARKER_PREFIX = re.compile(r"(?:FINAL(?:_VAR)?|NEEDS_MORE|UNABLE)\s*\(", re.IGNORECASE)
+
+# All marker patterns as one alternation, for existence checks in a single pass
+_ANY_FINAL_MARKER = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for _, pattern in _FINAL_PATTERNS),
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _loads_final_content(content_str: str) -> Any:
+    """Parse FINAL marker content as JSON, falling back to the raw string.
+
+    Uses orjson when installed, except for content with a run of 19 or more
+    digits: orjson silently reads integers wider than 64 bits as floats, where
+    json returns the exact int.
+
+    Args:
+        content_str: Captured FINAL(...) content.
+
+    Returns:
+        Parsed JSON value, or content_str itself if it is not valid JSON.
+    """
+    if _ORJSON_AVAILABLE and not _WIDE_DIGITS_RE.search(content_str):
+        try:
+            return orjson.loads(content_str)
+        except orjson.JSONDecodeError:
+            pass  # Retry with json: it also accepts NaN/Infinity
+    try:
+        return json.loads(content_str)
+    except json.JSONDecodeError:
+        # Try as raw string if not valid JSON
+        return content_str
+
+
 def parse_final_markers(text: str) -> list[ParsedFinalMarker]:
     """Parse FINAL/FINAL_VAR/NEEDS_MORE/UNABLE markers from agent response.
 
@@ -590,27 +929,18 @@ def parse_final_markers(text: str) -> list[ParsedFinalMarker]:
     """
     markers = []
 
-    # Pattern for each marker type
-    # Uses non-greedy matching for content, handles nested parentheses for JSON
-    patterns = [
-        (FinalMarkerType.FINAL, r"FINAL\s*\(\s*(\{.*?\}|\[.*?\]|\".*?\"|'.*?'|\d+|true|false|null)\s*\)"),
-        (FinalMarkerType.FINAL_VAR, r"FINAL_VAR\s*\(\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\)"),
-        (FinalMarkerType.NEEDS_MORE, r"NEEDS_MORE\s*\(\s*[\"'](.+?)[\"']\s*\)"),
-        (FinalMarkerType.UNABLE, r"UNABLE\s*\(\s*[\"'](.+?)[\"']\s*\)"),
-    ]
+    # Cheap prefilter: C-level substring scan, then one keyword pass
+    if "(" not in text or not _FINAL_MARKER_PREFIX.search(text):
+        return markers
 
-    for marker_type, pattern in patterns:
-        for match in re.finditer(pattern, text, re.DOTALL | re.IGNORECASE):
+    for marker_type, pattern in _FINAL_PATTERNS:
+        for match in pattern.finditer(text):
             raw_match = match.group(0)
             content_str = match.group(1)
 
             # Parse content based on marker type
             if marker_type == FinalMarkerType.FINAL:
-                try:
-                    content = json.loads(content_str)
-                except json.JSONDecodeError:
-                    # Try as raw string if not valid JSON
-                    content = content_str
+                content = _loads_final_content(content_str)
             elif marker_type == FinalMarkerType.FINAL_VAR:
                 content = content_str  # Variable name
             else:
@@ -677,4 +1007,5 @@ def has_final_marker(text: str) -> bool:
     Returns:
         True if any FINAL/FINAL_VAR/NEEDS_MORE/UNABLE marker is present.
     """
-    return len(parse_final_markers(text)) > 0
+    # Single pass over the combined pattern; no JSON parsing or marker objects
+    return "(" in text and _ANY_FINAL_MARKER.search(text) is not None
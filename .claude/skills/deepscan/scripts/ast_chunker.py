@@ -21,19 +21,38 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import gc
 import hashlib
 import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, fields
+from itertools import accumulate
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
-
 if TYPE_CHECKING:
     pass  # tree-sitter types for IDE support
 
 logger = logging.getLogger(__name__)
 
+# Optional tree-sitter backends, resolved once instead of on every file
+try:
+    from tree_sitter_language_pack import get_parser as _get_parser_pack
+except ImportError:
+    _get_parser_pack = None
+
+try:
+    from tree_sitter_languages import get_parser as _get_parser_legacy
+except ImportError:
+    _get_parser_legacy = None
+
+# Per-thread parser cache: {language: parser}. A tree-sitter Parser must not
+# be used by two threads at once, so each thread keeps its own instances.
+_PARSER_POOL = threading.local()
+
 
 # =============================================================================
 # Configuration Constants
@@ -137,15 +156,38 @@ MIN_FILES_FOR_MEMORY_GC = 10  # Minimum files before memory-pressure GC (prevent
 # Token estimation safety margin (80% utilization per vibe_check/Gemini advice)
 TOKEN_SAFETY_MARGIN = 0.80
 
+# Translation table deleting every character for which str.isspace() is True.
+# All such code points lie at or below U+3000 (IDEOGRAPHIC SPACE), so scanning
+# that range once at import yields the exact set used by count_tokens().
+_WHITESPACE_DELETE = str.maketrans(
+    "", "", "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+)
+
+# count_tokens() memoization: only texts up to this many characters are cached,
+# bounding the cache's memory to roughly maxsize * this many characters.
+_TOKEN_CACHE_MAX_CHARS = 4_096
+_TOKEN_CACHE_SIZE = 4_096
+
+# Spacing of byte->char anchors for non-ASCII sources (see _DecodedSource)
+_CHAR_ANCHOR_STRIDE = 1_024
+
+# Line boundaries str.splitlines() honours besides "\n" and "\r"
+_EXTRA_LINE_BREAKS = "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
 
 # =============================================================================
 # Data Models
 # =============================================================================
 
 
-class SemanticChunk(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SemanticChunk:
     """A semantically meaningful code chunk.
 
+    A slotted dataclass rather than a pydantic model: chunks are built in
+    bulk from already-typed values, so per-instance validation only added
+    construction cost and a per-instance __dict__.
+
     Attributes:
         chunk_id: Deterministic ID (NOT random) for caching compatibility.
         content: The actual code content.
@@ -154,12 +196,15 @@ class SemanticChunk(BaseModel):
         node_type: AST node type (e.g., "function_definition", "gap_content").
         language: Programming language (e.g., "python", "javascript").
         file_path: Source file path (relative for cache portability).
-        char_count: Character count (auto-calculated).
-        token_count: Estimated token count (auto-calculated).
+        char_count: Character count (auto-calculated when not provided).
+        token_count: Estimated token count (auto-calculated when not provided).
         is_fallback: True if text-based split was used instead of AST.
+        byte_range: (start, end) byte offsets of content in the source file
+            when it is exactly one AST byte range. Lets chunk IDs hash the
+            original bytes; not serialized.
     """
 
-    chunk_id: str = Field(default="pending")
+    chunk_id: str = "pending"
     content: str
     start_line: int
     end_line: int
@@ -171,11 +216,26 @@ class SemanticChunk(BaseModel):
     char_count: int = 0
     token_count: int = 0
     is_fallback: bool = False
+    byte_range: tuple[int, int] | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Calculate char_count and token_count after creation.
 
-    def model_post_init(self, __context: Any) -> None:
-        """Calculate char_count and token_count after model creation."""
-        self.char_count = len(self.content)
-        self.token_count = count_tokens(self.content)
+        Callers that already measured the content (extract_scopes_v2) pass
+        both counts in, so the content is not scanned a second time.
+        """
+        if not self.char_count:
+            self.char_count = len(self.content)
+        if not self.token_count:
+            self.token_count = count_tokens(self.content)
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the serializable fields as a dict (pydantic-compatible shim).
+
+        Returns:
+            Field name to value mapping, excluding byte_range.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "byte_range"}
 
     @classmethod
     def with_deterministic_id(
@@ -206,6 +266,95 @@ class SemanticChunk(BaseModel):
         )
 
 
+class _DecodedSource:
+    """File content decoded once, sliced by tree-sitter byte offsets.
+
+    Decoding each node's byte range separately re-decodes the same bytes at
+    every nesting level of extract_scopes_v2. Instead, the whole file is
+    decoded once and byte offsets are mapped to str offsets:
+
+    - ASCII: byte offsets are char offsets.
+    - Valid UTF-8: anchors every _CHAR_ANCHOR_STRIDE bytes record the char
+      offset, so mapping decodes at most one stride of bytes. Ranges shorter
+      than a stride are cheaper to decode directly and are not mapped.
+    - Invalid UTF-8 (or an offset inside a multi-byte sequence): the range is
+      decoded on its own with errors="replace", exactly as before.
+    """
+
+    __slots__ = ("_anchor_bytes", "_anchor_chars", "content", "text")
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self._anchor_bytes: list[int] | None = None
+        self._anchor_chars: list[int] = []
+        if content.isascii():
+            self.text: str | None = content.decode("ascii")
+            return
+        try:
+            self.text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            self.text = None
+            return
+
+        anchor_bytes = [0]
+        anchor_chars = [0]
+        size = len(content)
+        prev = 0
+        for pos in range(_CHAR_ANCHOR_STRIDE, size, _CHAR_ANCHOR_STRIDE):
+            # Move forward to the next character boundary
+            while pos < size and 0x80 <= content[pos] <= 0xBF:
+                pos += 1
+            if pos >= size:
+                break
+            anchor_chars.append(anchor_chars[-1] + len(content[prev:pos].decode("utf-8")))
+            anchor_bytes.append(pos)
+            prev = pos
+        self._anchor_bytes = anchor_bytes
+        self._anchor_chars = anchor_chars
+
+    def slice(self, start_byte: int, end_byte: int) -> str:
+        """Return content[start_byte:end_byte] decoded as UTF-8 (errors="replace")."""
+        text = self.text
+        anchor_bytes = self._anchor_bytes
+        if anchor_bytes is None:
+            if text is not None:
+                return text[start_byte:end_byte]
+            return self.content[start_byte:end_byte].decode("utf-8", errors="replace")
+
+        content = self.content
+        size = len(content)
+        if (
+            end_byte - start_byte < _CHAR_ANCHOR_STRIDE
+            or (start_byte < size and 0x80 <= content[start_byte] <= 0xBF)
+            or (end_byte < size and 0x80 <= content[end_byte] <= 0xBF)
+        ):
+            return content[start_byte:end_byte].decode("utf-8", errors="replace")
+        return text[self._char_offset(start_byte) : self._char_offset(end_byte)]
+
+    def raw(self, start_byte: int, end_byte: int) -> memoryview | None:
+        """Return the bytes whose UTF-8 decoding is slice(start_byte, end_byte).
+
+        Returns None when decoding is lossy (invalid UTF-8 or an offset inside
+        a multi-byte sequence), in which case the decoded text must be hashed.
+        """
+        if self.text is None:
+            return None
+        content = self.content
+        if self._anchor_bytes is not None:
+            size = len(content)
+            if (start_byte < size and 0x80 <= content[start_byte] <= 0xBF) or (
+                end_byte < size and 0x80 <= content[end_byte] <= 0xBF
+            ):
+                return None
+        return memoryview(content)[start_byte:end_byte]
+
+    def _char_offset(self, byte_offset: int) -> int:
+        """Map a byte offset on a character boundary to a str offset."""
+        i = bisect_right(self._anchor_bytes, byte_offset) - 1
+        anchor = self._anchor_bytes[i]
+        return self._anchor_chars[i] + len(self.content[anchor:byte_offset].decode("utf-8"))
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -220,7 +369,15 @@ def detect_language(file_path: Path) -> str | None:
     Returns:
         Language name (e.g., "python") or None if unknown.
     """
-    ext = file_path.suffix.lower()
+    # Same suffix rule as Path.suffix, without building the intermediate object
+    name = file_path.name
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return None
+    ext = name[dot:]
+    # Suffixes are almost always lowercase already; skip the copy then
+    if not ext.islower():
+        ext = ext.lower()
     return LANGUAGE_BY_EXTENSION.get(ext)
 
 
@@ -230,6 +387,8 @@ def count_tokens(text: str) -> int:
     Uses character-based estimation with language-aware adjustments.
     Returns RAW estimate - safety margin (TOKEN_SAFETY_MARGIN) is applied
     by the caller (extract_scopes_v2) when comparing against limits.
+    Results for short texts are memoized, since the same gap and statement
+    text recurs across chunks and files.
 
     Args:
         text: The text to count tokens for.
@@ -237,22 +396,41 @@ def count_tokens(text: str) -> int:
     Returns:
         Estimated token count (raw, without safety margin).
     """
+    if len(text) > _TOKEN_CACHE_MAX_CHARS:
+        return _count_tokens_impl(text)
+    return _count_tokens_cached(text)
+
+
+@functools.lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def _count_tokens_cached(text: str) -> int:
+    """Memoized count_tokens() for texts up to _TOKEN_CACHE_MAX_CHARS."""
+    return _count_tokens_impl(text)
+
+
+def _count_tokens_impl(text: str) -> int:
+    """Uncached token estimate backing count_tokens()."""
     if not text:
         return 0
 
     # Base estimate: ~4 characters per token for code
-    base_estimate = len(text) // 4
-
-    # Adjust for whitespace-heavy content (indentation)
-    whitespace_ratio = sum(1 for c in text if c.isspace()) / max(len(text), 1)
-    if whitespace_ratio > 0.3:
+    length = len(text)
+    base_estimate = length >> 2
+
+    # Adjust for whitespace-heavy content (indentation). Both branches count
+    # whitespace in C instead of a per-character generator: translate() has an
+    # ASCII fast path, while str.split() stays fast on wide (non-ASCII) strings.
+    if text.isascii():
+        whitespace = length - len(text.translate(_WHITESPACE_DELETE))
+    else:
+        whitespace = length - sum(map(len, text.split()))
+    if whitespace * 10 > length * 3:
         # Heavily indented code has fewer tokens per character
-        base_estimate = int(base_estimate * 0.8)
+        base_estimate = (base_estimate * 4) // 5
 
     return max(1, base_estimate)
 
 
-def generate_chunk_id(file_path: str, start_line: int, content: str) -> str:
+def generate_chunk_id(file_path: str, start_line: int, content: str | bytes) -> str:
     """Generate deterministic chunk ID.
 
     Uses hash of file path + start line + full content to ensure
@@ -260,42 +438,95 @@ def generate_chunk_id(file_path: str, start_line: int, content: str) -> str:
 
     Note: Uses relative path format for cache portability across machines.
     Updated: Uses incremental hashing to avoid memory spikes on large chunks.
+    SHA-256 is kept deliberately: IDs must not depend on optional packages,
+    and with SHA-NI it outruns BLAKE2b on chunk-sized inputs.
 
     Args:
         file_path: Source file path (preferably relative).
         start_line: Starting line number.
-        content: Chunk content.
+        content: Chunk content, as str or its UTF-8 encoded bytes.
 
     Returns:
         8-character hex ID.
     """
-    # Incremental hashing to avoid memory spike from f-string concatenation
-    sha = hashlib.sha256()
-    sha.update(file_path.encode("utf-8"))
-    sha.update(b":")
-    sha.update(str(start_line).encode("utf-8"))
-    sha.update(b":")
-    sha.update(content.encode("utf-8"))
+    # Hash the short "path:line:" prefix in one shot, then stream the content
+    sha = hashlib.sha256(f"{file_path}:{start_line}:".encode())
+    sha.update(content.encode("utf-8") if isinstance(content, str) else content)
     return sha.hexdigest()[:8]
 
 
-def get_line_number(content: bytes, byte_offset: int) -> int:
+def newline_offsets(content: bytes) -> list[int]:
+    """Find the byte offset of every newline in content.
+
+    Args:
+        content: Full file content as bytes.
+
+    Returns:
+        Sorted newline offsets, for repeated get_line_number() lookups.
+    """
+    offsets: list[int] = []
+    find = content.find
+    pos = find(b"\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = find(b"\n", pos + 1)
+    return offsets
+
+
+def get_line_number(content: bytes, byte_offset: int, line_breaks: list[int] | None = None) -> int:
     """Get 1-based line number for a byte offset.
 
     .. deprecated::
-        This function has O(N) complexity per call. For batch processing,
-        use AST node attributes (node.start_point, node.end_point) instead,
-        which provide O(1) access to line numbers. This function is retained
-        for backward compatibility and edge cases in fallback text chunking.
+        Without line_breaks this function is O(N) per call. For batch
+        processing, use AST node attributes (node.start_point, node.end_point)
+        instead, or compute newline_offsets(content) once and pass it as
+        line_breaks for O(log L) lookups. This function is retained for
+        backward compatibility and edge cases in fallback text chunking.
 
     Args:
         content: Full file content as bytes.
         byte_offset: Byte position in the content.
+        line_breaks: Precomputed newline_offsets(content), if available.
 
     Returns:
         1-based line number.
     """
-    return content[:byte_offset].count(b"\n") + 1
+    if line_breaks is not None:
+        return bisect_left(line_breaks, byte_offset) + 1
+    # Count in place rather than copying content[:byte_offset]
+    return content.count(b"\n", 0, byte_offset) + 1
+
+
+def _line_ends(text: str) -> list[int]:
+    """End offsets of the lines text.splitlines(keepends=True) would return.
+
+    Only offsets are produced, so callers can slice multi-line ranges out of
+    text without materializing one str per line.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        Exclusive end offset of each line, in order.
+    """
+    # A lone "\r" or a rarer separator (\f, U+2028, ...) also ends a line:
+    # defer to splitlines() itself. Each substring test is a C-speed scan,
+    # and a "\r\n" pair already ends at its "\n".
+    if ("\r" in text and text.count("\r") != text.count("\r\n")) or any(
+        sep in text for sep in _EXTRA_LINE_BREAKS
+    ):
+        return list(accumulate(map(len, text.splitlines(keepends=True))))
+
+    ends: list[int] = []
+    find = text.find
+    pos = find("\n")
+    while pos != -1:
+        pos += 1
+        ends.append(pos)
+        pos = find("\n", pos)
+    if len(text) > (ends[-1] if ends else 0):
+        ends.append(len(text))  # Last line without a trailing newline
+    return ends
 
 
 def split_text_lines(text: str, max_chars: int) -> list[str]:
@@ -308,22 +539,21 @@ def split_text_lines(text: str, max_chars: int) -> list[str]:
     Returns:
         List of text chunks.
     """
-    lines = text.splitlines(keepends=True)
+    # Each chunk is the longest run of whole lines fitting in max_chars (at
+    # least one line), found by bisecting line end offsets and sliced from
+    # text directly instead of splitting into lines and re-joining them.
+    line_ends = _line_ends(text)
     chunks: list[str] = []
-    current_chunk: list[str] = []
-    current_size = 0
-
-    for line in lines:
-        if current_size + len(line) > max_chars and current_chunk:
-            chunks.append("".join(current_chunk))
-            current_chunk = [line]
-            current_size = len(line)
-        else:
-            current_chunk.append(line)
-            current_size += len(line)
+    start = 0
+    i = 0
+    n_lines = len(line_ends)
 
-    if current_chunk:
-        chunks.append("".join(current_chunk))
+    while i < n_lines:
+        last = max(bisect_right(line_ends, start + max_chars, i) - 1, i)
+        end = line_ends[last]
+        chunks.append(text[start:end])
+        start = end
+        i = last + 1
 
     return chunks
 
@@ -337,37 +567,46 @@ def get_parser_safe(language: str) -> Any | None:
     Returns None if neither package is available,
     allowing graceful fallback to text-based chunking.
 
+    Parsers are pooled per thread and language, so repeated calls on the
+    same thread reuse one instance instead of building a new parser for
+    every file. Do not hand the returned parser to another thread.
+
     Args:
         language: Programming language name.
 
     Returns:
         Parser instance or None if unavailable.
     """
-    # Try tree-sitter-language-pack first (maintained, Python 3.13 support)
-    try:
-        from tree_sitter_language_pack import get_parser
-
-        parser = get_parser(language)
+    pool = getattr(_PARSER_POOL, "parsers", None)
+    if pool is None:
+        pool = _PARSER_POOL.parsers = {}
+    parser = pool.get(language)
+    if parser is not None:
         return parser
-    except ImportError:
-        pass  # Try fallback
-    except Exception as e:
-        logger.debug(f"tree-sitter-language-pack failed for {language}: {e}")
 
-    # Fallback to tree-sitter-languages (legacy, Python 3.12 and earlier)
-    try:
-        from tree_sitter_languages import get_parser
+    # Try tree-sitter-language-pack first (maintained, Python 3.13 support)
+    if _get_parser_pack is not None:
+        try:
+            parser = _get_parser_pack(language)
+        except Exception as e:
+            logger.debug(f"tree-sitter-language-pack failed for {language}: {e}")
+        else:
+            pool[language] = parser
+            return parser
 
-        parser = get_parser(language)
-        return parser
-    except ImportError:
+    # Fallback to tree-sitter-languages (legacy, Python 3.12 and earlier)
+    if _get_parser_legacy is None:
         logger.warning(
             "No tree-sitter package available. Install with: poetry add tree-sitter-language-pack"
         )
         return None
+    try:
+        parser = _get_parser_legacy(language)
     except Exception as e:
         logger.warning(f"Failed to get parser for {language}: {e}")
         return None
+    pool[language] = parser
+    return parser
 
 
 # =============================================================================
@@ -430,6 +669,12 @@ def chunk_file_ast(
         return fallback_text_chunk(resolved_path, max_chunk_chars, project_root)
 
     # 3. Parse file
+    # Read into one bytes object rather than mmap: the tree dwarfs the source
+    # buffer, legacy tree_sitter_languages parsers only accept bytes, and a
+    # file truncated while mapped would kill the process with SIGBUS. A shared
+    # bytearray reused across files saves ~2us on small files, is slower on
+    # large ones (the decoders need an exact-size copy) and is unsafe once
+    # chunk_file_ast runs on several threads.
     try:
         content = resolved_path.read_bytes()
         tree = parser.parse(content)
@@ -448,6 +693,7 @@ def chunk_file_ast(
 
     # 5. Coalescing Iterator extraction
     chunks: list[SemanticChunk] = []
+    source = _DecodedSource(content)
     extract_scopes_v2(
         node=tree.root_node,
         content=content,
@@ -458,21 +704,120 @@ def chunk_file_ast(
         file_path=rel_path,
         depth=0,
         max_depth=max_depth,
+        source=source,
+        scope_types=SCOPE_TYPES_BY_LANGUAGE.get(language, set()),
+        compound_types=COMPOUND_TYPES_BY_LANGUAGE.get(language, set()),
+        effective_max_tokens=int(max_chunk_tokens * TOKEN_SAFETY_MARGIN),
     )
 
     # 6. Cleanup tree (memory management)
     del tree
 
     # 7. Assign deterministic chunk IDs
+    _assign_chunk_ids(chunks, rel_path, source)
+
+    return chunks
+
+
+def _assign_chunk_ids(chunks: list[SemanticChunk], file_path: str, source: _DecodedSource) -> None:
+    """Assign deterministic IDs to a file's pending chunks in one batch.
+
+    Produces the same IDs as generate_chunk_id(), with per-file work done
+    once: the "path:" prefix is hashed a single time and each chunk's hasher
+    starts from a copy of that state. Chunks that map to one byte range hash
+    the source bytes directly instead of re-encoding their text.
+
+    Args:
+        chunks: Chunks of one file; those with chunk_id "pending" get an ID.
+        file_path: Path used for chunk IDs (relative for portability).
+        source: Decoded view of the file the chunks were cut from.
+    """
+    path_state = hashlib.sha256(f"{file_path}:".encode())
+    raw = source.raw
     for chunk in chunks:
-        if chunk.chunk_id == "pending":
-            chunk.chunk_id = generate_chunk_id(
-                file_path=rel_path,
-                start_line=chunk.start_line,
-                content=chunk.content,
+        if chunk.chunk_id != "pending":
+            continue
+        data = raw(*chunk.byte_range) if chunk.byte_range else None
+        sha = path_state.copy()
+        sha.update(f"{chunk.start_line}:".encode())
+        sha.update(chunk.content.encode("utf-8") if data is None else data)
+        chunk.chunk_id = sha.hexdigest()[:8]
+
+
+def _append_text_split(
+    chunks: list[SemanticChunk],
+    text: str,
+    max_chars: int,
+    base_line: int,
+    node_type: str,
+    language: str,
+    file_path: str,
+) -> None:
+    """Split oversized text at line boundaries and append fallback chunks.
+
+    Args:
+        chunks: Output list of chunks.
+        text: Text larger than max_chars.
+        max_chars: Maximum characters per chunk.
+        base_line: 1-based line number of the first line of text.
+        node_type: node_type recorded on every piece (e.g., "gap_split").
+        language: Programming language.
+        file_path: Source file path (for chunk IDs).
+    """
+    current_line_offset = 0
+    for tc in split_text_lines(text, max_chars):
+        chunk_line_count = tc.count("\n")
+        chunks.append(
+            SemanticChunk(
+                content=tc,
+                start_line=base_line + current_line_offset,
+                end_line=base_line + current_line_offset + chunk_line_count,
+                node_type=node_type,
+                language=language,
+                file_path=file_path,
+                is_fallback=True,
             )
+        )
+        current_line_offset += chunk_line_count
 
-    return chunks
+
+def _append_depth_limit_fallback(
+    node: Any,
+    source: _DecodedSource,
+    chunks: list[SemanticChunk],
+    max_chars: int,
+    max_depth: int,
+    language: str,
+    file_path: str,
+) -> None:
+    """Emit a node past max_depth as text instead of descending into it."""
+    logger.warning(f"Max recursion depth {max_depth} reached, using text fallback")
+    node_text = source.slice(node.start_byte, node.end_byte)
+
+    # Check if node is too large even for fallback
+    if len(node_text) > max_chars:
+        _append_text_split(
+            chunks,
+            node_text,
+            max_chars,
+            node.start_point[0] + 1,
+            "depth_limit_split",
+            language,
+            file_path,
+        )
+    else:
+        chunks.append(
+            SemanticChunk(
+                content=node_text,
+                start_line=node.start_point[0] + 1,
+                end_line=node.end_point[0] + 1,
+                node_type="depth_limit_fallback",
+                language=language,
+                file_path=file_path,
+                is_fallback=True,
+                byte_range=(node.start_byte, node.end_byte),
+            )
+        )
 
 
 def extract_scopes_v2(
@@ -486,6 +831,10 @@ def extract_scopes_v2(
     depth: int = 0,
     max_depth: int = 50,
     last_byte: int = 0,
+    source: _DecodedSource | None = None,
+    scope_types: set[str] | None = None,
+    compound_types: set[str] | None = None,
+    effective_max_tokens: int | None = None,
 ) -> int:
     """Coalescing Iterator: captures ALL content including gaps.
 
@@ -496,6 +845,11 @@ def extract_scopes_v2(
     4. Handling compound statements as atomic units
     5. Treating ERROR nodes as leaf content (graceful degradation)
 
+    Over-budget scopes are descended into with an explicit stack of frames
+    rather than Python recursion, so deep trees cost no interpreter frames;
+    max_depth still bounds the descent (DoS protection). Per-file values
+    (source, node type sets, token budget) are computed once up front.
+
     Args:
         node: Current AST node.
         content: Full file content as bytes.
@@ -504,256 +858,238 @@ def extract_scopes_v2(
         max_tokens: Maximum tokens per chunk.
         language: Programming language.
         file_path: Source file path (for chunk IDs).
-        depth: Current recursion depth.
-        max_depth: Maximum recursion depth (DoS protection).
+        depth: Depth of node in the descent.
+        max_depth: Maximum descent depth (DoS protection).
         last_byte: Last processed byte position.
+        source: Decoded view of content (built from content when omitted).
+        scope_types: Scope node types for language (looked up when omitted).
+        compound_types: Compound node types for language (looked up when omitted).
+        effective_max_tokens: max_tokens with TOKEN_SAFETY_MARGIN applied
+            (computed when omitted).
 
     Returns:
         Last processed byte position after this node.
     """
     # Apply token safety margin (80% utilization to prevent context overflow)
-    effective_max_tokens = int(max_tokens * TOKEN_SAFETY_MARGIN)
+    if effective_max_tokens is None:
+        effective_max_tokens = int(max_tokens * TOKEN_SAFETY_MARGIN)
+    if scope_types is None:
+        scope_types = SCOPE_TYPES_BY_LANGUAGE.get(language, set())
+    if compound_types is None:
+        compound_types = COMPOUND_TYPES_BY_LANGUAGE.get(language, set())
+    if source is None:
+        source = _DecodedSource(content)
 
     # Security: Prevent deep recursion (Issue S2)
     if depth > max_depth:
-        logger.warning(f"Max recursion depth {max_depth} reached, using text fallback")
-        node_text = content[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
-
-        # Check if node is too large even for fallback
-        if len(node_text) > max_chars:
-            text_chunks = split_text_lines(node_text, max_chars)
-            base_line = node.start_point[0] + 1
-            current_line_offset = 0
-
-            for tc in text_chunks:
-                chunk_line_count = tc.count("\n")
-                chunks.append(
-                    SemanticChunk(
-                        content=tc,
-                        start_line=base_line + current_line_offset,
-                        end_line=base_line + current_line_offset + chunk_line_count,
-                        node_type="depth_limit_split",
-                        language=language,
-                        file_path=file_path,
-                        is_fallback=True,
-                    )
-                )
-                current_line_offset += chunk_line_count
-        else:
-            chunks.append(
-                SemanticChunk(
-                    content=node_text,
-                    start_line=node.start_point[0] + 1,
-                    end_line=node.end_point[0] + 1,
-                    node_type="depth_limit_fallback",
-                    language=language,
-                    file_path=file_path,
-                    is_fallback=True,
-                )
-            )
+        _append_depth_limit_fallback(
+            node, source, chunks, max_chars, max_depth, language, file_path
+        )
         return node.end_byte
 
-    scope_types = SCOPE_TYPES_BY_LANGUAGE.get(language, set())
-    compound_types = COMPOUND_TYPES_BY_LANGUAGE.get(language, set())
-
-    # Track position within this node
-    current_byte = node.start_byte if last_byte < node.start_byte else last_byte
-
+    # Each frame: [scope node, child iterator, current_byte, current_line_tracker, depth].
     # Issue X Fix: Track line position using AST node attributes instead of O(N) byte scanning
-    # node.start_point is (row, col) where row is 0-indexed
-    current_line_tracker = node.start_point[0] + 1
-
-    for child in node.children:
-        # 1. CAPTURE GAP before this child
-        if child.start_byte > current_byte:
-            gap_text = content[current_byte : child.start_byte].decode("utf-8", errors="replace")
-            if gap_text.strip():  # Non-empty gap
-                # Issue X Fix: Use tracked line position instead of O(N) get_line_number()
-                gap_start_line = current_line_tracker
-                gap_end_line = child.start_point[0] + 1
-
-                if len(gap_text) > max_chars:
-                    # Large gap - split
-                    gap_chunks = split_text_lines(gap_text, max_chars)
-                    base_line = gap_start_line  # Use tracked position
-                    current_line_offset = 0
-
-                    for gc_chunk in gap_chunks:
-                        chunk_line_count = gc_chunk.count("\n")
+    # (node.start_point is (row, col) where row is 0-indexed)
+    stack: list[list[Any]] = [
+        [
+            node,
+            iter(node.children),
+            max(last_byte, node.start_byte),
+            node.start_point[0] + 1,
+            depth,
+        ]
+    ]
+
+    while stack:
+        frame = stack[-1]
+        scope_node, children, current_byte, current_line_tracker, node_depth = frame
+        descend_into = None
+
+        for child in children:
+            # Read each node attribute once: every access is a call into the
+            # tree-sitter binding that builds a fresh Python object.
+            child_start = child.start_byte
+            child_end = child.end_byte
+            child_type = child.type
+            child_start_line = child.start_point[0] + 1
+            child_end_line = child.end_point[0] + 1
+
+            # 1. CAPTURE GAP before this child
+            if child_start > current_byte:
+                gap_text = source.slice(current_byte, child_start)
+                if gap_text.strip():  # Non-empty gap
+                    # Issue X Fix: Use tracked line position instead of O(N) get_line_number()
+                    if len(gap_text) > max_chars:
+                        # Large gap - split
+                        _append_text_split(
+                            chunks,
+                            gap_text,
+                            max_chars,
+                            current_line_tracker,
+                            "gap_split",
+                            language,
+                            file_path,
+                        )
+                    else:
                         chunks.append(
                             SemanticChunk(
-                                content=gc_chunk,
-                                start_line=base_line + current_line_offset,
-                                end_line=base_line + current_line_offset + chunk_line_count,
-                                node_type="gap_split",
+                                content=gap_text,
+                                start_line=current_line_tracker,  # Use tracked position
+                                end_line=child_start_line,  # Use AST node attribute
+                                node_type="gap_content",
                                 language=language,
                                 file_path=file_path,
-                                is_fallback=True,
+                                byte_range=(current_byte, child_start),
                             )
                         )
-                        current_line_offset += chunk_line_count
-                else:
+
+            # 2. PROCESS this child
+            child_text = source.slice(child_start, child_end)
+            child_chars = len(child_text)
+            # Only nodes that can still become a single chunk need a token count;
+            # oversized nodes are split or descended, so counting them would
+            # rescan the same text once per nesting level.
+            child_tokens = count_tokens(child_text) if child_chars <= max_chars else 0
+
+            # Check node type
+            is_scope = child_type in scope_types
+            is_compound = child_type in compound_types
+            is_error = child_type == "ERROR"
+
+            # Handle ERROR nodes (Gemini feedback: treat as leaf content)
+            if is_error:
+                if child_chars <= max_chars:
                     chunks.append(
                         SemanticChunk(
-                            content=gap_text,
-                            start_line=gap_start_line,  # Use tracked position
-                            end_line=gap_end_line,  # Use AST node attribute
-                            node_type="gap_content",
+                            content=child_text,
+                            start_line=child_start_line,
+                            end_line=child_end_line,
+                            node_type="syntax_error_block",
                             language=language,
                             file_path=file_path,
+                            char_count=child_chars,
+                            token_count=child_tokens,
+                            byte_range=(child_start, child_end),
+                            is_fallback=True,
                         )
                     )
-
-        # 2. PROCESS this child
-        child_text = content[child.start_byte : child.end_byte].decode("utf-8", errors="replace")
-        child_tokens = count_tokens(child_text)
-        child_chars = len(child_text)
-
-        # Check node type
-        is_scope = child.type in scope_types
-        is_compound = child.type in compound_types
-        is_error = child.type == "ERROR"
-
-        # Handle ERROR nodes (Gemini feedback: treat as leaf content)
-        if is_error:
-            if child_chars <= max_chars:
-                chunks.append(
-                    SemanticChunk(
-                        content=child_text,
-                        start_line=child.start_point[0] + 1,
-                        end_line=child.end_point[0] + 1,
-                        node_type="syntax_error_block",
-                        language=language,
-                        file_path=file_path,
-                        is_fallback=True,
+                else:
+                    # Large error block - text split
+                    _append_text_split(
+                        chunks,
+                        child_text,
+                        max_chars,
+                        child_start_line,
+                        "syntax_error_split",
+                        language,
+                        file_path,
                     )
-                )
-            else:
-                # Large error block - text split
-                text_chunks = split_text_lines(child_text, max_chars)
-                base_line = child.start_point[0] + 1
-                current_line_offset = 0
+                current_byte = child_end
+                continue
 
-                for tc in text_chunks:
-                    chunk_line_count = tc.count("\n")
+            if is_scope or is_compound:
+                if child_chars <= max_chars and child_tokens <= effective_max_tokens:
+                    # Whole scope/compound fits - add as single chunk
                     chunks.append(
                         SemanticChunk(
-                            content=tc,
-                            start_line=base_line + current_line_offset,
-                            end_line=base_line + current_line_offset + chunk_line_count,
-                            node_type="syntax_error_split",
+                            content=child_text,
+                            start_line=child_start_line,
+                            end_line=child_end_line,
+                            node_type=child_type,
                             language=language,
                             file_path=file_path,
-                            is_fallback=True,
+                            char_count=child_chars,
+                            token_count=child_tokens,
+                            byte_range=(child_start, child_end),
                         )
                     )
-                    current_line_offset += chunk_line_count
-            current_byte = child.end_byte
-            continue
-
-        if is_scope or is_compound:
-            if child_chars <= max_chars and child_tokens <= effective_max_tokens:
-                # Whole scope/compound fits - add as single chunk
-                chunks.append(
-                    SemanticChunk(
-                        content=child_text,
-                        start_line=child.start_point[0] + 1,
-                        end_line=child.end_point[0] + 1,
-                        node_type=child.type,
-                        language=language,
-                        file_path=file_path,
-                    )
-                )
-            else:
-                # Too big - recurse into this scope/compound
-                extract_scopes_v2(
-                    node=child,
-                    content=content,
-                    chunks=chunks,
-                    max_chars=max_chars,
-                    max_tokens=max_tokens,
-                    language=language,
-                    file_path=file_path,
-                    depth=depth + 1,
-                    max_depth=max_depth,
-                    last_byte=child.start_byte,
-                )
-        else:
-            # Non-scope content (imports, constants, etc.)
-            if child_chars <= max_chars:
-                chunks.append(
-                    SemanticChunk(
-                        content=child_text,
-                        start_line=child.start_point[0] + 1,
-                        end_line=child.end_point[0] + 1,
-                        node_type=child.type,
-                        language=language,
-                        file_path=file_path,
+                elif node_depth + 1 > max_depth:
+                    # Security: Prevent deep recursion (Issue S2)
+                    _append_depth_limit_fallback(
+                        child, source, chunks, max_chars, max_depth, language, file_path
                     )
-                )
+                else:
+                    # Too big - descend into this scope/compound after this child
+                    descend_into = child
             else:
-                # Large non-scope content - use text split
-                text_chunks = split_text_lines(child_text, max_chars)
-                base_line = child.start_point[0] + 1
-                current_line_offset = 0
-
-                for tc in text_chunks:
-                    chunk_line_count = tc.count("\n")
+                # Non-scope content (imports, constants, etc.)
+                if child_chars <= max_chars:
                     chunks.append(
                         SemanticChunk(
-                            content=tc,
-                            start_line=base_line + current_line_offset,
-                            end_line=base_line + current_line_offset + chunk_line_count,
-                            node_type="text_split",
+                            content=child_text,
+                            start_line=child_start_line,
+                            end_line=child_end_line,
+                            node_type=child_type,
                             language=language,
                             file_path=file_path,
-                            is_fallback=True,
+                            char_count=child_chars,
+                            token_count=child_tokens,
+                            byte_range=(child_start, child_end),
                         )
                     )
-                    current_line_offset += chunk_line_count
-
-        current_byte = child.end_byte
-        # Issue X Fix: Update line tracker using AST node attribute (O(1))
-        current_line_tracker = child.end_point[0] + 1
-
-    # 3. CAPTURE trailing content after last child
-    if node.end_byte > current_byte:
-        trailing = content[current_byte : node.end_byte].decode("utf-8", errors="replace")
-        if trailing.strip():
-            # Issue X Fix: Use tracked line position instead of O(N) get_line_number()
-            trailing_start_line = current_line_tracker
-            trailing_end_line = node.end_point[0] + 1
-
-            if len(trailing) > max_chars:
-                text_chunks = split_text_lines(trailing, max_chars)
-                base_line = trailing_start_line  # Use tracked position
-                current_line_offset = 0
-
-                for tc in text_chunks:
-                    chunk_line_count = tc.count("\n")
+                else:
+                    # Large non-scope content - use text split
+                    _append_text_split(
+                        chunks,
+                        child_text,
+                        max_chars,
+                        child_start_line,
+                        "text_split",
+                        language,
+                        file_path,
+                    )
+
+            current_byte = child_end
+            # Issue X Fix: Update line tracker using AST node attribute (O(1))
+            current_line_tracker = child_end_line
+
+            if descend_into is not None:
+                break
+
+        if descend_into is not None:
+            # Save this frame's position, then process the child's frame first;
+            # the remaining children resume from the saved iterator afterwards.
+            frame[2] = current_byte
+            frame[3] = current_line_tracker
+            stack.append(
+                [
+                    descend_into,
+                    iter(descend_into.children),
+                    descend_into.start_byte,
+                    descend_into.start_point[0] + 1,
+                    node_depth + 1,
+                ]
+            )
+            continue
+
+        # 3. CAPTURE trailing content after last child
+        stack.pop()
+        if scope_node.end_byte > current_byte:
+            trailing = source.slice(current_byte, scope_node.end_byte)
+            if trailing.strip():
+                # Issue X Fix: Use tracked line position instead of O(N) get_line_number()
+                if len(trailing) > max_chars:
+                    _append_text_split(
+                        chunks,
+                        trailing,
+                        max_chars,
+                        current_line_tracker,
+                        "trailing_split",
+                        language,
+                        file_path,
+                    )
+                else:
                     chunks.append(
                         SemanticChunk(
-                            content=tc,
-                            start_line=base_line + current_line_offset,
-                            end_line=base_line + current_line_offset + chunk_line_count,
-                            node_type="trailing_split",
+                            content=trailing,
+                            start_line=current_line_tracker,  # Use tracked position
+                            end_line=scope_node.end_point[0] + 1,
+                            node_type="trailing_content",
                             language=language,
                             file_path=file_path,
-                            is_fallback=True,
+                            byte_range=(current_byte, scope_node.end_byte),
                         )
                     )
-                    current_line_offset += chunk_line_count
-            else:
-                chunks.append(
-                    SemanticChunk(
-                        content=trailing,
-                        start_line=trailing_start_line,  # Use tracked position
-                        end_line=trailing_end_line,
-                        node_type="trailing_content",
-                        language=language,
-                        file_path=file_path,
-                    )
-                )
 
     return node.end_byte
 
@@ -795,8 +1131,9 @@ def fallback_text_chunk(
         logger.error(f"Failed to read {file_path}: {e}")
         return []
 
-    lines = content.splitlines(keepends=True)
-    if not lines:
+    # Line boundaries as offsets; chunk text is sliced from content directly
+    line_ends = _line_ends(content)
+    if not line_ends:
         return []
 
     # Calculate relative path
@@ -812,62 +1149,106 @@ def fallback_text_chunk(
     language = detect_language(resolved_path) or "unknown"
 
     chunks: list[SemanticChunk] = []
-    current_chunk: list[str] = []
-    current_size = 0
-    start_line = 1  # 1-based line numbers
-
-    for i, line in enumerate(lines):
-        line_number = i + 1  # Convert to 1-based
-
-        if current_size + len(line) > max_chunk_chars and current_chunk:
+    # The current chunk is lines [first_line, i), i.e. content[chunk_start:line_start];
+    # its size is an offset difference, so no per-line list or running sum is kept.
+    first_line = 0
+    chunk_start = 0
+    line_start = 0
+
+    for i, line_end in enumerate(line_ends):
+        if line_end - chunk_start > max_chunk_chars and i > first_line:
             # Save current chunk
-            chunk_content = "".join(current_chunk)
             chunks.append(
                 SemanticChunk.with_deterministic_id(
                     file_path=rel_path,
-                    start_line=start_line,
-                    content=chunk_content,
-                    end_line=line_number - 1,
+                    start_line=first_line + 1,  # 1-based line numbers
+                    content=content[chunk_start:line_start],
+                    end_line=i,
                     node_type="text_fallback",
                     language=language,
                     is_fallback=True,
                 )
             )
 
-            # Start new chunk with overlap
+            # Start new chunk with overlap (the last lines of the saved chunk)
+            chunk_lines = range(first_line, i)
             overlap_lines = (
-                current_chunk[-overlap_lines_count:]
-                if len(current_chunk) >= overlap_lines_count
-                else current_chunk[:]
+                chunk_lines[-overlap_lines_count:]
+                if len(chunk_lines) >= overlap_lines_count
+                else chunk_lines
             )
-            current_chunk = overlap_lines + [line]
-            current_size = sum(len(ln) for ln in current_chunk)
-
-            # Calculate new start line
-            start_line = max(1, line_number - len(overlap_lines))
-        else:
-            current_chunk.append(line)
-            current_size += len(line)
+            first_line = overlap_lines[0] if overlap_lines else i
+            chunk_start = line_ends[first_line - 1] if first_line else 0
+        line_start = line_end
 
     # Final chunk
-    if current_chunk:
-        chunk_content = "".join(current_chunk)
-        chunks.append(
-            SemanticChunk.with_deterministic_id(
-                file_path=rel_path,
-                start_line=start_line,
-                content=chunk_content,
-                end_line=len(lines),
-                node_type="text_fallback",
-                language=language,
-                is_fallback=True,
-            )
+    chunks.append(
+        SemanticChunk.with_deterministic_id(
+            file_path=rel_path,
+            start_line=first_line + 1,
+            content=content[chunk_start : line_ends[-1]],
+            end_line=len(line_ends),
+            node_type="text_fallback",
+            language=language,
+            is_fallback=True,
         )
+    )
 
     return chunks
 
 
-from collections.abc import Iterator  # noqa: E402
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+_PROC_STATM = "/proc/self/statm"
+
+
+def _make_rss_probe() -> Callable[[], float] | None:
+    """Build a probe returning the current resident set size in MB.
+
+    On Linux this reads /proc/self/statm directly (one small read, no
+    third-party import). Elsewhere psutil is used when installed.
+    resource.getrusage() is not an option: ru_maxrss is the *peak* RSS, so
+    once crossed it would report memory pressure for the rest of the run.
+
+    Returns:
+        Zero-argument probe, or None if RSS cannot be measured.
+    """
+    if os.path.exists(_PROC_STATM):
+        page_mb = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+        def _statm_rss_mb() -> float:
+            with open(_PROC_STATM, "rb") as f:
+                return int(f.read().split()[1]) * page_mb
+
+        return _statm_rss_mb
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    process = psutil.Process()
+    return lambda: process.memory_info().rss / (1024 * 1024)
+
+
+def _chunk_file_gc_paused(
+    file_path: Path, max_chunk_chars: int, project_root: Path | None
+) -> list[SemanticChunk]:
+    """Run chunk_file_ast() with the cyclic garbage collector paused.
+
+    Parsing allocates many short-lived, acyclic objects (nodes, slices,
+    chunks) that reference counting frees; generation-0 collections during
+    that burst only rescan them. Collection stays paused for this one file
+    and is restored before returning, so callers' code never runs with GC
+    disabled; chunk_files_safely() still collects explicitly between files.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return chunk_file_ast(file_path, max_chunk_chars, project_root=project_root)
+    finally:
+        if was_enabled:
+            gc.enable()
 
 
 def chunk_files_safely(
@@ -876,6 +1257,7 @@ def chunk_files_safely(
     gc_interval: int = GC_EVERY_N_FILES,
     memory_threshold_mb: int = MEMORY_THRESHOLD_MB,
     project_root: Path | None = None,
+    workers: int = 1,
 ) -> Iterator[SemanticChunk]:
     """Process files with optimized memory cleanup (generator version).
 
@@ -884,6 +1266,12 @@ def chunk_files_safely(
     2. gc.collect() every N files (not every file!)
     3. Optional: trigger GC on memory pressure (with minimum interval to prevent thrashing)
     4. Tree objects are deleted immediately after use
+    5. The cyclic GC is paused while each file is parsed (see
+       _chunk_file_gc_paused); it is re-enabled before chunks are yielded
+
+    With workers > 1, files are parsed in a process pool. Chunks are still
+    yielded in file_paths order, but results of files finished ahead of the
+    consumer are buffered in this process until they are yielded.
 
     Args:
         file_paths: List of files to process.
@@ -891,50 +1279,66 @@ def chunk_files_safely(
         gc_interval: Run gc.collect() every N files (default: 50).
         memory_threshold_mb: Trigger GC if memory exceeds this (MB).
         project_root: Project root for relative path calculation.
+        workers: Number of worker processes (1 = parse serially in-process).
 
     Yields:
         SemanticChunk objects as they are created.
     """
-    # Import psutil once at function start (not in loop)
-    try:
-        import psutil
-
-        _psutil_available = True
-        _process = psutil.Process()
-    except ImportError:
-        _psutil_available = False
-        _process = None
+    # Resolve the RSS probe once at function start (not in loop)
+    rss_mb = _make_rss_probe()
+    # Sample memory only after a quarter of the GC interval, not after every file
+    min_files_for_probe = max(MIN_FILES_FOR_MEMORY_GC, gc_interval // 4)
 
     files_since_gc = 0
 
-    for i, file_path in enumerate(file_paths):
-        # Parse and chunk
-        chunks = chunk_file_ast(file_path, max_chunk_chars, project_root=project_root)
-        # Yield immediately instead of accumulating (memory optimization)
-        yield from chunks
-        files_since_gc += 1
-
-        # Determine if GC is needed
-        should_gc = False
-
-        # Strategy 1: Interval-based
-        if files_since_gc >= gc_interval:
-            should_gc = True
-
-        # Strategy 2: Memory pressure (requires minimum file interval to prevent thrashing)
-        if _psutil_available and _process and files_since_gc >= MIN_FILES_FOR_MEMORY_GC:
-            try:
-                memory_mb = _process.memory_info().rss / (1024 * 1024)
-                if memory_mb > memory_threshold_mb:
-                    should_gc = True
-                    logger.debug(f"Memory pressure detected: {memory_mb:.1f}MB")
-            except Exception:
-                pass  # Error checking memory
-
-        if should_gc:
-            gc.collect()
-            files_since_gc = 0
-            logger.debug(f"GC triggered after {i + 1} files")
+    # Parse and chunk: in-process, or fanned out to a process pool (each
+    # worker keeps its own parser pool); both produce per-file results in order
+    executor = None
+    if workers > 1 and len(file_paths) > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        per_file = executor.map(
+            functools.partial(
+                _chunk_file_gc_paused, max_chunk_chars=max_chunk_chars, project_root=project_root
+            ),
+            file_paths,
+            chunksize=8,
+        )
+    else:
+        per_file = (
+            _chunk_file_gc_paused(file_path, max_chunk_chars, project_root)
+            for file_path in file_paths
+        )
+
+    try:
+        for i, chunks in enumerate(per_file):
+            # Yield immediately instead of accumulating (memory optimization)
+            yield from chunks
+            files_since_gc += 1
+
+            # Determine if GC is needed
+            should_gc = False
+
+            # Strategy 1: Interval-based
+            if files_since_gc >= gc_interval:
+                should_gc = True
+
+            # Strategy 2: Memory pressure (requires minimum file interval to prevent thrashing)
+            if rss_mb is not None and files_since_gc >= min_files_for_probe:
+                try:
+                    memory_mb = rss_mb()
+                    if memory_mb > memory_threshold_mb:
+                        should_gc = True
+                        logger.debug(f"Memory pressure detected: {memory_mb:.1f}MB")
+                except Exception:
+                    pass  # Error checking memory
+
+            if should_gc:
+                gc.collect()
+                files_since_gc = 0
+                logger.debug(f"GC triggered after {i + 1} files")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     # Final cleanup
     gc.collect()
@@ -946,6 +1350,7 @@ def chunk_files_to_list(
     gc_interval: int = GC_EVERY_N_FILES,
     memory_threshold_mb: int = MEMORY_THRESHOLD_MB,
     project_root: Path | None = None,
+    workers: int = 1,
 ) -> list[SemanticChunk]:
     """Convenience wrapper that returns a list instead of generator.
 
@@ -958,6 +1363,7 @@ def chunk_files_to_list(
         gc_interval: Run gc.collect() every N files.
         memory_threshold_mb: Trigger GC if memory exceeds this.
         project_root: Project root for relative path calculation.
+        workers: Number of worker processes (1 = parse serially in-process).
 
     Returns:
         List of all SemanticChunk objects.
@@ -969,6 +1375,7 @@ def chunk_files_to_list(
             gc_interval,
             memory_threshold_mb,
             project_root,
+            workers,
         )
     )
 
@@ -997,5 +1404,6 @@ __all__ = [
     "generate_chunk_id",
     "get_parser_safe",
     "get_line_number",
+    "newline_offsets",
     "split_text_lines",
 ]
@@ -10,7 +10,7 @@ Design based on:
 - pal/Gemini analysis (signal handler re-entrancy safety)
 
 Key Design Decisions:
-1. Use sys.stderr.write() in signal handler (not Rich - re-entrancy safe)
+1. Use os.write(2, ...) in signal handler (not Rich/sys.stderr - re-entrancy safe)
 2. Exit code 130 (128 + SIGINT Unix convention)
 3. on_cleanup callback for Rich UI coordination
 4. Second Ctrl+C always triggers force quit (no timing threshold)
@@ -47,16 +47,41 @@ __all__ = [
     "atomic_write_with_cancellation",
 ]
 
+import itertools
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
+# Only Windows needs the rename retry loop: there, antivirus scanners and
+# indexers briefly lock files, so os.replace() can raise a transient
+# PermissionError. Elsewhere a PermissionError is permanent.
+_RENAME_NEEDS_RETRY = sys.platform == "win32"
+
+# show_resume_instructions() output, with and without ANSI colors
+_ANSI_GREEN = "\033[92m"
+_ANSI_CYAN = "\033[96m"
+_ANSI_RESET = "\033[0m"
+_RESUME_TEMPLATE_COLOR = (
+    f"\n{_ANSI_GREEN}Progress saved.{_ANSI_RESET}\n"
+    f"Resume with: {_ANSI_CYAN}deepscan --resume %s{_ANSI_RESET}\n"
+)
+_RESUME_TEMPLATE_PLAIN = "\nProgress saved.\nResume with: deepscan --resume %s\n"
+
+# Upper bound for the exponential retry backoff in atomic_write_with_cancellation()
+# (a larger retry_delay is still honoured)
+_MAX_RETRY_DELAY = 1.0
+
+# atomic_write_with_cancellation() encodes and writes content in slices of
+# this many characters, bounding the extra memory to one encoded slice
+_WRITE_CHUNK_CHARS = 64 * 1024
+
 
 class CancellationError(Exception):
     """Raised when operation is cancelled by user."""
@@ -73,7 +98,9 @@ class CancellationManager:
 
     Behavior:
     - First Ctrl+C: Sets graceful cancellation flag, starts timeout thread
-    - Second Ctrl+C: Immediately force quits with exit code 130
+    - Second Ctrl+C: Immediately force quits with exit code 130 (waiting at most
+      FORCE_CALLBACK_TIMEOUT for on_force, and not at all without one)
+    - Third Ctrl+C: Exits at once if the force quit is still in progress
     - Timeout: Force quits if graceful shutdown takes too long
 
     Attributes:
@@ -91,6 +118,16 @@ class CancellationManager:
     # Exit code constants
     EXIT_CODE_FORCE_QUIT = 130  # 128 + SIGINT (2)
 
+    # Longest force quit delay for on_force; the wait ends as soon as it returns
+    FORCE_CALLBACK_TIMEOUT = 0.5
+
+    # Signal handler messages, pre-encoded for a single os.write(2, ...)
+    _MSG_GRACEFUL = (
+        b"\n[!] Cancellation requested. Finishing current work...\n"
+        b"    (Press Ctrl+C again to force quit)\n"
+    )
+    _MSG_FORCE = b"\n[!] Force quitting...\n    Warning: Progress may not be fully saved\n"
+
     def __init__(
         self,
         graceful_timeout: float = 10.0,
@@ -103,13 +140,19 @@ class CancellationManager:
         Args:
             graceful_timeout: Seconds before auto-force quit after first Ctrl+C.
             on_graceful: Callback when graceful shutdown starts (e.g., save checkpoint).
-            on_force: Callback when force quit triggered (before os._exit).
+            on_force: Callback when force quit triggered, by a second Ctrl+C or the
+                graceful timeout (before os._exit).
             on_cleanup: Callback to release UI resources (called FIRST, before messages).
                        Use this to stop Rich progress bars before printing.
         """
-        self._cancel_event = threading.Event()
-        self._force_event = threading.Event()
-        self._completed_event = threading.Event()
+        # State flags. Readers poll the bools directly (attribute reads are
+        # atomic); writers set them under one shared Condition and notify, so
+        # waiters use wait_for() instead of one threading.Event per flag.
+        self._state = threading.Condition()
+        self._cancelled_flag = False
+        self._force_flag = False
+        self._completed_flag = False
+        self._force_callback_done = False
 
         # Issue AD Fix: Validate graceful_timeout
         if graceful_timeout <= 0:
@@ -121,11 +164,16 @@ class CancellationManager:
         self._on_cleanup = on_cleanup
 
         self._cancel_count = 0
-        self._last_signal_time: float | None = None
-        self._graceful_start_time: float | None = None
+        self._cancel_counter = itertools.count(1)
         self._lock = threading.Lock()
 
-        self._timeout_thread: threading.Thread | None = None
+        # Persistent workers (started by setup()) so the signal handler only
+        # enqueues work instead of spawning threads on every Ctrl+C
+        self._callback_queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._timeout_queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._workers_started = False
+        self._workers_stopped = False
+        self._force_exit_called = False
 
     def setup(self) -> None:
         """Set up signal handlers.
@@ -134,88 +182,219 @@ class CancellationManager:
         - SIGINT (Ctrl+C): All platforms
         - SIGTERM: Unix/Linux/macOS only (not available on Windows)
 
+        On Unix the Python-level handler is a no-op: signal.set_wakeup_fd()
+        makes the interpreter write each signal number to a pipe, and a pump
+        thread runs _handle_signal() from there. Nothing runs re-entrantly on
+        the interrupted main thread, and signals are handled promptly even
+        while the main thread is stuck in a long C call. Windows (and a wakeup
+        fd already owned by e.g. an asyncio loop) keeps the direct handler.
+
         Should be called once at program start, before any interruptible work.
+        Also starts the callback and timeout worker threads.
         """
-        signal.signal(signal.SIGINT, self._handle_signal)
+        self._start_workers()
+        handler = _wakeup_only if self._install_signal_pump() else self._handle_signal
+        signal.signal(signal.SIGINT, handler)
 
         # SIGTERM only on Unix-like systems (Issue E Fix)
         # Windows doesn't support SIGTERM via signal.signal()
         if sys.platform != "win32":
-            signal.signal(signal.SIGTERM, self._handle_signal)
+            signal.signal(signal.SIGTERM, handler)
+
+    def _install_signal_pump(self) -> bool:
+        """Route signals through a wakeup-fd pipe read by a pump thread.
+
+        Returns:
+            True if the pump is installed, False to use the direct handler.
+        """
+        global _signal_pump
+
+        if sys.platform == "win32":
+            # set_wakeup_fd() only accepts sockets on Windows
+            return False
+
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        try:
+            previous = signal.set_wakeup_fd(write_fd, warn_on_full_buffer=False)
+        except ValueError:
+            # Not the main thread; signal.signal() will raise the same error
+            os.close(read_fd)
+            os.close(write_fd)
+            return False
+
+        if previous != -1 and (_signal_pump is None or previous != _signal_pump[2]):
+            # Someone else owns the wakeup fd: give it back
+            signal.set_wakeup_fd(previous)
+            os.close(read_fd)
+            os.close(write_fd)
+            return False
+
+        if _signal_pump is not None:
+            # Closing the previous manager's write end ends its pump thread
+            os.close(_signal_pump[2])
+        _signal_pump = (self, read_fd, write_fd)
+        threading.Thread(
+            target=self._signal_pump,
+            args=(read_fd,),
+            daemon=True,
+            name="CancellationSignals",
+        ).start()
+        return True
+
+    def _signal_pump(self, read_fd: int) -> None:
+        """Run the double-tap state machine for each signal written to the pipe."""
+        _block_termination_signals()
+        handled = (signal.SIGINT, signal.SIGTERM)
+        try:
+            while data := os.read(read_fd, 64):
+                for signum in data:
+                    if signum in handled:
+                        self._handle_signal(signum, None)
+        except OSError:
+            pass
+        finally:
+            os.close(read_fd)
+
+    def _start_workers(self) -> None:
+        """Start the callback and timeout worker threads (once per manager).
+
+        Callbacks and the graceful timeout run on separate threads so that a
+        callback that hangs cannot also stall the timeout force quit.
+        """
+        if self._workers_started:
+            return
+        self._workers_started = True
+        threading.Thread(
+            target=self._callback_worker,
+            daemon=True,
+            name="CancellationCallbacks",
+        ).start()
+        threading.Thread(
+            target=self._timeout_worker,
+            daemon=True,
+            name="CancellationTimeout",
+        ).start()
+
+    def _stop_workers(self) -> None:
+        """Stop the callback and timeout worker threads.
+
+        Called when the global manager is replaced, so each reset does not
+        leave two more threads blocked on their queues. A pending graceful
+        timeout is cancelled as well. The manager must not be used afterwards.
+        """
+        with self._state:
+            self._workers_stopped = True
+            self._state.notify_all()
+        if self._workers_started:
+            self._callback_queue.put_nowait("stop")
+            self._timeout_queue.put_nowait("stop")
 
     def _handle_signal(self, signum: int, frame) -> None:
         """Handle interrupt signal.
 
         First signal: Set graceful flag, start timeout thread
         Second signal: Force quit immediately
+        Third+ signal: Exit at once if the force quit has not finished (e.g.
+            blocked flushing a full stdout pipe)
 
-        Uses sys.stderr.write() instead of print()/Rich to avoid
-        re-entrancy issues with terminal output (Gemini recommendation).
+        Uses a single os.write(2, ...) instead of print()/Rich/sys.stderr to
+        avoid re-entrancy issues with terminal output (Gemini recommendation):
+        no stream lock, no buffer, no encoding.
 
-        DEADLOCK FIX: Callbacks are executed in a separate thread to prevent
+        DEADLOCK FIX: Callbacks are executed on a worker thread to prevent
         deadlock when callbacks need locks that might be held by main thread.
-        Signal handlers should only set flags and perform minimal re-entrant operations.
+        Signal handlers should only set flags and perform minimal re-entrant operations,
+        so the handler only enqueues work for the persistent workers.
         """
-        now = time.time()
-
-        with self._lock:
-            self._cancel_count += 1
-
-            if self._cancel_count == 1:
-                # First Ctrl+C: Graceful shutdown
-                self._graceful_start_time = now
-                self._last_signal_time = now
-                self._cancel_event.set()
-
-                # Output message using sys.stderr.write (re-entrancy safe)
-                sys.stderr.write("\n[!] Cancellation requested. Finishing current work...\n")
-                sys.stderr.write("    (Press Ctrl+C again to force quit)\n")
-                sys.stderr.flush()
-
-                # DEADLOCK FIX: Execute callbacks in separate thread
-                # This prevents deadlock if callbacks need locks held by main thread
-                # (e.g., Rich's Progress.stop() needs internal locks)
-                threading.Thread(
-                    target=self._execute_graceful_callbacks,
-                    daemon=True,
-                    name="CancellationCallbacks",
-                ).start()
-
-                # Start timeout thread
-                self._timeout_thread = threading.Thread(
-                    target=self._graceful_timeout_thread,
-                    daemon=True,
-                    name="CancellationTimeout",
-                )
-                self._timeout_thread.start()
-
+        if not self._workers_started:
+            # setup() was bypassed (handler invoked directly)
+            self._start_workers()
+
+        # No lock here: the pump thread (or the main thread, for the direct
+        # handler) is the only caller, and a direct handler re-entered by a
+        # second signal would deadlock on a non-reentrant lock. next() on
+        # itertools.count is atomic under the GIL.
+        self._cancel_count = count = next(self._cancel_counter)
+
+        if count == 1:
+            # First Ctrl+C: Graceful shutdown
+            with self._state:
+                self._cancelled_flag = True
+                self._state.notify_all()
+
+            # Output message with one write(2) syscall (re-entrancy safe)
+            _write_stderr(self._MSG_GRACEFUL)
+
+            # DEADLOCK FIX: Execute callbacks on the callback worker
+            # This prevents deadlock if callbacks need locks held by main thread
+            # (e.g., Rich's Progress.stop() needs internal locks)
+            self._callback_queue.put_nowait("graceful")
+
+            # Start the graceful timeout
+            self._timeout_queue.put_nowait("arm")
+
+        elif self._force_exit_called:
+            # A force quit (second tap or timeout) is under way but stuck:
+            # skip the flushes and callbacks and leave now
+            os._exit(self.EXIT_CODE_FORCE_QUIT)
+
+        else:
+            # Second+ Ctrl+C: Force quit
+            with self._state:
+                self._force_flag = True
+                self._state.notify_all()
+
+            _write_stderr(self._MSG_FORCE)
+
+            # Force exit with proper cleanup (Issue M Fix)
+            if threading.current_thread() is threading.main_thread():
+                # Direct handler: a further Ctrl+C cannot run this handler
+                # while it is busy here, so hand SIGINT back to the default
+                # action, which terminates the process
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self._force_exit()
+            else:
+                # Signal pump: exit from the timeout worker so the pump stays
+                # free to act on a third tap
+                self._timeout_queue.put_nowait("force")
+
+    def _callback_worker(self) -> None:
+        """Run callbacks queued by the signal handler, in order, until "stop"."""
+        while (message := self._callback_queue.get()) != "stop":
+            if message == "graceful":
+                self._execute_graceful_callbacks()
             else:
-                # Second+ Ctrl+C: Force quit
-                self._force_event.set()
-
-                sys.stderr.write("\n[!] Force quitting...\n")
-                sys.stderr.write("    Warning: Progress may not be fully saved\n")
-                sys.stderr.flush()
-
-                # DEADLOCK FIX: Execute force callback in separate thread
-                # Give it a brief moment to complete before force exit
-                if self._on_force:
-                    callback_thread = threading.Thread(
-                        target=self._safe_callback,
-                        args=(self._on_force, "Force"),
-                        daemon=True,
-                        name="ForceCallback",
-                    )
-                    callback_thread.start()
-                    callback_thread.join(timeout=0.5)  # Brief wait for callback
-
-                # Force exit with proper cleanup (Issue M Fix)
+                self._safe_callback(self._on_force, "Force")
+                with self._state:
+                    self._force_callback_done = True
+                    self._state.notify_all()
+
+    def _timeout_worker(self) -> None:
+        """Arm the graceful timeout ("arm") and run pump force quits ("force").
+
+        Waiting for the completed flag (rather than sleeping, or starting a
+        threading.Timer per signal) lets the worker stand down as soon as
+        mark_completed() is called. A force quit also ends the wait; its
+        "force" message is then next in the queue. "stop" ends the worker.
+        """
+        _block_termination_signals()
+        while (message := self._timeout_queue.get()) != "stop":
+            if message == "force":
                 self._force_exit()
+                continue
+            with self._state:
+                self._state.wait_for(
+                    lambda: self._completed_flag or self._force_flag or self._workers_stopped,
+                    self.graceful_timeout,
+                )
+            if not (self._completed_flag or self._force_flag or self._workers_stopped):
+                self._graceful_timeout_expired()
 
     def _execute_graceful_callbacks(self) -> None:
         """Execute graceful shutdown callbacks outside signal handler.
 
-        DEADLOCK FIX: This runs in a separate thread to avoid holding
+        DEADLOCK FIX: This runs on the callback worker thread to avoid holding
         signal handler context while executing potentially blocking callbacks.
         """
         # Call cleanup callback FIRST to release Rich UI
@@ -236,10 +415,10 @@ class CancellationManager:
             try:
                 callback()
             except Exception as e:
-                logger.warning(f"{name} callback failed: {e}")
+                logger.warning("%s callback failed: %s", name, e)
 
-    def _graceful_timeout_thread(self) -> None:
-        """Thread that forces quit after graceful timeout.
+    def _graceful_timeout_expired(self) -> None:
+        """Force quit once the graceful timeout elapsed (runs on the timeout worker).
 
         IMPORTANT (Issue F Fix): Uses os._exit() instead of sys.exit() because:
         - sys.exit() only raises SystemExit in the current thread
@@ -248,31 +427,42 @@ class CancellationManager:
 
         This ensures the timeout actually works when the main thread
         is blocked on I/O operations.
-        """
-        time.sleep(self.graceful_timeout)
-
-        with self._lock:
-            # Check if still in graceful mode (not completed, not already force)
-            if (
-                self._cancel_event.is_set()
-                and not self._force_event.is_set()
-                and not self._completed_event.is_set()
-            ):
-                sys.stderr.write(
-                    f"\n[!] Graceful shutdown timed out after {self.graceful_timeout}s\n"
-                )
-                sys.stderr.write("    Force quitting...\n")
-                sys.stderr.flush()
 
-                self._force_event.set()
-                self._force_exit()
+        No lock: the flags are atomic reads, and racing a second Ctrl+C at
+        worst reaches _force_exit() twice, which it tolerates.
+        """
+        # Check if still in graceful mode (not already force). Completion
+        # is re-checked: mark_completed() may land after the wait expired.
+        if self._cancelled_flag and not self._force_flag and not self._completed_flag:
+            sys.stderr.write(f"\n[!] Graceful shutdown timed out after {self.graceful_timeout}s\n")
+            sys.stderr.write("    Force quitting...\n")
+            sys.stderr.flush()
+
+            with self._state:
+                self._force_flag = True
+                self._state.notify_all()
+            self._force_exit()
 
     def _force_exit(self) -> None:
         """Force exit the process with proper cleanup.
 
         Issue M Fix: Flush stdout/stderr before os._exit() for observability.
         os._exit() doesn't flush buffers - any pending log messages would be lost.
+        Only the first caller (signal handler or timeout worker) proceeds, and
+        on_force runs for either trigger.
         """
+        if self._force_exit_called:
+            return
+        self._force_exit_called = True
+
+        # DEADLOCK FIX: Execute force callback on the callback worker
+        # Give it a brief moment to complete before force exit; with no
+        # callback registered there is nothing to wait for
+        if self._on_force:
+            self._callback_queue.put_nowait("force")
+            with self._state:  # Brief wait, ends early once the callback returns
+                self._state.wait_for(lambda: self._force_callback_done, self.FORCE_CALLBACK_TIMEOUT)
+
         sys.stdout.flush()
         sys.stderr.flush()
         os._exit(self.EXIT_CODE_FORCE_QUIT)
@@ -285,7 +475,7 @@ class CancellationManager:
         Returns:
             True if graceful cancellation was requested, False otherwise.
         """
-        return self._cancel_event.is_set()
+        return self._cancelled_flag
 
     def is_force_quit(self) -> bool:
         """Check if force quit was triggered.
@@ -295,7 +485,7 @@ class CancellationManager:
         Returns:
             True if force quit was triggered, False otherwise.
         """
-        return self._force_event.is_set()
+        return self._force_flag
 
     def check_and_raise(self) -> None:
         """Check cancellation and raise if force quit was triggered.
@@ -306,9 +496,24 @@ class CancellationManager:
         Raises:
             CancellationError: If force quit was triggered.
         """
-        if self._force_event.is_set():
+        if self._force_flag:
             raise CancellationError("Force quit triggered")
 
+    def wait_for_force_quit(self, timeout: float) -> bool:
+        """Block until force quit is triggered or timeout elapses.
+
+        Use instead of time.sleep() in retry loops so a double tap is not
+        delayed by the sleep.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if force quit was triggered, False on timeout.
+        """
+        with self._state:
+            return self._state.wait_for(lambda: self._force_flag, timeout)
+
     def mark_completed(self) -> None:
         """Mark graceful shutdown as completed.
 
@@ -326,7 +531,9 @@ class CancellationManager:
                 cancel_mgr.mark_completed()  # Prevent timeout force quit
                 cancel_mgr.show_resume_instructions(session_hash)
         """
-        self._completed_event.set()
+        with self._state:
+            self._completed_flag = True
+            self._state.notify_all()
 
     def reset(self) -> None:
         """Reset cancellation state (for testing).
@@ -334,12 +541,14 @@ class CancellationManager:
         Warning: This should only be used in tests, not in production code.
         """
         with self._lock:
-            self._cancel_event.clear()
-            self._force_event.clear()
-            self._completed_event.clear()
+            with self._state:
+                self._cancelled_flag = False
+                self._force_flag = False
+                self._completed_flag = False
+                self._force_callback_done = False
+            self._force_exit_called = False
             self._cancel_count = 0
-            self._last_signal_time = None
-            self._graceful_start_time = None
+            self._cancel_counter = itertools.count(1)
 
     @staticmethod
     def show_resume_instructions(session_hash: str) -> None:
@@ -351,13 +560,79 @@ class CancellationManager:
         Args:
             session_hash: Unique session identifier for resume command.
         """
-        # Use ANSI colors for visibility (simple, no Rich dependency)
-        GREEN = "\033[92m"
-        CYAN = "\033[96m"
-        RESET = "\033[0m"
+        # Use ANSI colors for visibility (simple, no Rich dependency), but
+        # only on a terminal: piped/redirected output gets plain text
+        stdout = sys.stdout
+        if stdout.isatty() and os.environ.get("TERM") != "dumb":
+            template = _RESUME_TEMPLATE_COLOR
+        else:
+            template = _RESUME_TEMPLATE_PLAIN
+        stdout.write(template % session_hash)
+
+
+def _write_stderr(data: bytes) -> None:
+    """Write data to fd 2 with os.write(), ignoring a closed/invalid stderr."""
+    try:
+        os.write(2, data)
+    except OSError:
+        pass
+
+
+def _block_termination_signals() -> None:
+    """Block SIGINT/SIGTERM in the calling helper thread (POSIX only).
+
+    Python handlers always run on the main thread, but the kernel may deliver
+    a process-directed signal to any thread that does not block it. Delivered
+    to a helper, it leaves a main thread stuck in a blocking call (sleep, lock
+    wait) uninterrupted, delaying the direct handler until the call returns.
+    Only threads that run nothing but this module's code block the signals:
+    the callback worker runs user callbacks, whose subprocesses would
+    inherit the mask.
+    """
+    if hasattr(signal, "pthread_sigmask"):
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+
+
+def _wakeup_only(signum: int, frame) -> None:
+    """Python-level handler while the signal pump is installed.
+
+    The interpreter has already written signum to the wakeup fd; the pump
+    thread does the actual handling.
+    """
 
-        print(f"\n{GREEN}Progress saved.{RESET}")
-        print(f"Resume with: {CYAN}deepscan --resume {session_hash}{RESET}")
+
+# Active signal pump: (manager, read_fd, write_fd), process-wide like the wakeup fd
+_signal_pump: tuple[CancellationManager, int, int] | None = None
+
+
+def _reset_signal_pump_in_child() -> None:
+    """Detach a forked child from the parent's signal pump.
+
+    The child inherits the wakeup fd but not the pump thread, so its signals
+    would otherwise be counted as the parent's (one Ctrl+C to the process
+    group reaching N pool workers would look like N+1 taps).
+    """
+    global _signal_pump
+
+    if _signal_pump is None:
+        return
+    mgr, read_fd, write_fd = _signal_pump
+    _signal_pump = None
+    # Worker threads are not inherited either; restart them on first signal
+    mgr._workers_started = False
+    try:
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGINT, mgr._handle_signal)
+        signal.signal(signal.SIGTERM, mgr._handle_signal)
+    except ValueError:
+        # Forked from a non-main thread: the child cannot change handlers
+        pass
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_signal_pump_in_child)
 
 
 # =============================================================================
@@ -382,7 +657,8 @@ def get_cancellation_manager(
     provided parameters; subsequent calls return the same instance.
 
     Thread-safe: Uses lock to prevent race conditions during initialization
-    (Issue AC Fix).
+    (Issue AC Fix). Once the manager exists, it is returned without taking
+    the lock (double-checked locking; reading a module global is atomic).
 
     Args:
         graceful_timeout: Seconds before auto-force quit.
@@ -396,9 +672,16 @@ def get_cancellation_manager(
     """
     global _global_cancel_mgr
 
+    mgr = _global_cancel_mgr
+    if mgr is not None and not reset:
+        return mgr
+
     # Issue AC Fix: Thread-safe singleton initialization
     with _factory_lock:
         if _global_cancel_mgr is None or reset:
+            if _global_cancel_mgr is not None:
+                # Don't leak the replaced manager's worker threads
+                _global_cancel_mgr._stop_workers()
             _global_cancel_mgr = CancellationManager(
                 graceful_timeout=graceful_timeout,
                 on_graceful=on_graceful,
@@ -406,8 +689,7 @@ def get_cancellation_manager(
                 on_cleanup=on_cleanup,
             )
             _global_cancel_mgr.setup()
-
-    return _global_cancel_mgr
+        return _global_cancel_mgr
 
 
 # =============================================================================
@@ -417,80 +699,202 @@ def get_cancellation_manager(
 
 def atomic_write_with_cancellation(
     file_path: str,
-    content: str,
+    content: str | Iterable[str],
     cancel_mgr: CancellationManager | None = None,
     max_retries: int = 3,
     retry_delay: float = 0.1,
+    durable: bool = False,
 ) -> bool:
     """Write file atomically with cancellation check and Windows retry.
 
-    Uses temp-file-and-rename pattern for atomicity.
+    Uses temp-file-and-rename pattern for atomicity. The content is encoded
+    and written straight to a file descriptor in _WRITE_CHUNK_CHARS slices,
+    so a large payload never exists twice in memory (no text-mode newline
+    translation either, so the bytes on disk are identical on every platform).
     Includes Windows retry loop for file locking issues (Issue N Fix).
-    Checks cancellation flag in retry loop (Gemini recommendation).
+    Checks cancellation flag between slices and in retry loop (Gemini recommendation).
 
     Args:
         file_path: Path to write to.
-        content: Content to write.
-        cancel_mgr: Optional CancellationManager to check during retries.
-        max_retries: Maximum retry attempts for Windows file locking.
-        retry_delay: Delay between retries in seconds.
+        content: Content to write: a str, or an iterable of str pieces (e.g.
+            json.JSONEncoder().iterencode(obj)) written as they are produced.
+        cancel_mgr: Optional CancellationManager to check during the write and retries.
+        max_retries: Maximum retry attempts for Windows file locking (other
+            platforms rename once; see _RENAME_NEEDS_RETRY).
+        retry_delay: Delay before the first retry in seconds; doubles on each
+            further retry, up to _MAX_RETRY_DELAY. Cut short by force quit.
+        durable: If True, fsync the temp file before renaming it.
 
     Returns:
         True if write succeeded, False if cancelled during retry.
 
     Raises:
         PermissionError: If write fails after all retries.
-        CancellationError: If cancelled during retry.
+        OSError: If the write or the rename fails.
+        CancellationError: If force quit during the write or a retry.
     """
-    from pathlib import Path
-
-    target = Path(file_path)
-    tmp_file = target.with_suffix(target.suffix + ".tmp")
+    # Plain strings: the temp name is the target name plus ".tmp", exactly
+    # what Path.with_suffix(suffix + ".tmp") produced
+    target = os.fspath(file_path)
+    tmp_file = target + ".tmp"
 
     # Issue AA Fix: Write to temp file first with proper error handling
     try:
-        tmp_file.write_text(content, encoding="utf-8")
+        _write_fd(tmp_file, content, durable, cancel_mgr)
+    except CancellationError:
+        _remove_temp_file(tmp_file, "on force quit")
+        raise
     except Exception as e:
         # Clean up temp file if write fails
-        try:
-            tmp_file.unlink(missing_ok=True)
-        except Exception as cleanup_err:
-            # Issue AB Fix: Log cleanup failures instead of silent swallowing
-            logger.debug(f"Failed to cleanup temp file after write error: {cleanup_err}")
-        logger.error(f"Failed to write temp file {tmp_file}: {e}")
+        _remove_temp_file(tmp_file, "after write error")
+        logger.error("Failed to write temp file %s: %s", tmp_file, e)
+        raise
+
+    if _RENAME_NEEDS_RETRY:
+        return _replace_with_retry(tmp_file, target, cancel_mgr, max_retries, retry_delay)
+
+    if cancel_mgr and cancel_mgr.is_force_quit():
+        _remove_temp_file(tmp_file, "on force quit")
+        raise CancellationError("Operation force quit by user")
+    try:
+        os.replace(tmp_file, target)
+    except OSError as e:
+        _remove_temp_file(tmp_file, "after rename error")
+        logger.error("Failed to save file %s: %s", target, e)
         raise
+    return True
+
+
+def _replace_with_retry(
+    tmp_file: str,
+    target: str,
+    cancel_mgr: CancellationManager | None,
+    max_retries: int,
+    retry_delay: float,
+) -> bool:
+    """Rename tmp_file over target, retrying while the file is locked (Windows).
+
+    Args:
+        tmp_file: Fully written temp file.
+        target: Destination path.
+        cancel_mgr: Optional CancellationManager checked before each attempt.
+        max_retries: Maximum rename attempts.
+        retry_delay: Delay before the first retry in seconds.
+
+    Returns:
+        True once the rename succeeded.
 
+    Raises:
+        PermissionError: If the rename fails after all retries.
+        CancellationError: If force quit before an attempt.
+    """
     # Atomic rename with Windows retry (Issue N Fix)
+    max_delay = max(retry_delay, _MAX_RETRY_DELAY)
     for attempt in range(max_retries):
         # IMPORTANT: Only abort on Force Quit, not Graceful Cancellation!
         # Graceful cancellation's purpose is to SAVE progress before exiting.
         # Force quit (double tap) means user wants to exit immediately.
         if cancel_mgr and cancel_mgr.is_force_quit():
             # Clean up temp file on force quit
-            try:
-                tmp_file.unlink(missing_ok=True)
-            except Exception as e:
-                # Issue AB Fix: Log cleanup failures instead of silent swallowing
-                logger.debug(f"Failed to cleanup temp file on force quit: {e}")
+            _remove_temp_file(tmp_file, "on force quit")
             raise CancellationError("Operation force quit by user")
 
         try:
-            os.replace(str(tmp_file), str(target))
+            os.replace(tmp_file, target)
             return True
 
         except PermissionError as e:
             if attempt < max_retries - 1:
-                logger.debug(f"File locked during atomic write, retrying in {retry_delay}s: {e}")
-                time.sleep(retry_delay)
+                delay = min(retry_delay * 2**attempt, max_delay)
+                logger.debug("File locked during atomic write, retrying in %ss: %s", delay, e)
+                if cancel_mgr:
+                    # Returns early on force quit; the loop then raises
+                    cancel_mgr.wait_for_force_quit(delay)
+                else:
+                    time.sleep(delay)
             else:
                 # Clean up temp file before raising
-                try:
-                    tmp_file.unlink(missing_ok=True)
-                except Exception as cleanup_err:
-                    # Issue AB Fix: Log cleanup failures instead of silent swallowing
-                    logger.debug(f"Failed to cleanup temp file after retries: {cleanup_err}")
+                _remove_temp_file(tmp_file, "after retries")
 
-                logger.error(f"Failed to save file after {max_retries} attempts: {e}")
+                logger.error("Failed to save file after %d attempts: %s", max_retries, e)
                 raise
 
     return True
+
+
+def _write_fd(
+    path: str,
+    content: str | Iterable[str],
+    durable: bool,
+    cancel_mgr: CancellationManager | None,
+) -> None:
+    """Create/truncate path and write content as UTF-8 with os.write().
+
+    Args:
+        path: File to write.
+        content: A str, or an iterable of str pieces.
+        durable: If True, fsync before closing.
+        cancel_mgr: Checked for force quit before each slice.
+
+    Raises:
+        CancellationError: If force quit between slices.
+    """
+    if isinstance(content, str):
+        # A single slice of a short str is the str itself (no copy)
+        pieces: Iterable[str] = (
+            content[i : i + _WRITE_CHUNK_CHARS] for i in range(0, len(content), _WRITE_CHUNK_CHARS)
+        )
+    else:
+        pieces = _batched_text(content, _WRITE_CHUNK_CHARS)
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        for piece in pieces:
+            if cancel_mgr and cancel_mgr.is_force_quit():
+                raise CancellationError("Operation force quit by user")
+            view = memoryview(piece.encode("utf-8"))
+            while view:
+                view = view[os.write(fd, view) :]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _batched_text(pieces: Iterable[str], size: int) -> Iterator[str]:
+    """Join small str pieces into batches of at least size characters.
+
+    Args:
+        pieces: Text pieces, e.g. from JSONEncoder.iterencode().
+        size: Minimum batch length (the last batch may be shorter).
+
+    Yields:
+        Joined batches, so each os.write() call carries a useful payload.
+    """
+    batch: list[str] = []
+    length = 0
+    for piece in pieces:
+        batch.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield "".join(batch)
+            batch = []
+            length = 0
+    if batch:
+        yield "".join(batch)
+
+
+def _remove_temp_file(tmp_file: str, reason: str) -> None:
+    """Delete a leftover temp file, logging (not raising) cleanup failures.
+
+    Args:
+        tmp_file: Temp file path.
+        reason: When the cleanup happens, for the log message.
+    """
+    try:
+        os.unlink(tmp_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # Issue AB Fix: Log cleanup failures instead of silent swallowing
+        logger.debug("Failed to cleanup temp file %s: %s", reason, e)
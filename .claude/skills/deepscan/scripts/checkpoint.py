@@ -24,18 +24,34 @@ __all__ = [
 import json
 import logging
 import os
+import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 # Import shared security constants from models
 from models import (
+    DEFAULT_CACHE_ROOT,
     MAX_CHECKPOINT_READ_SIZE,
     MAX_CHECKPOINT_WRITE_SIZE,
     SESSION_HASH_PATTERN,
+    ChunkResult,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+# Optional orjson import (faster checkpoint parsing, falls back to json)
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# orjson reads integers outside the 64-bit range as floats instead of raising, so
+# files with a run of 19+ digits (a possible such integer) are parsed with json.
+_WIDE_DIGITS_RE = re.compile(rb"[0-9]{19}")
 
 if TYPE_CHECKING:
     from cancellation import CancellationManager
@@ -65,11 +81,88 @@ class Checkpoint(BaseModel):
     phase: str
     batch_index: int
     completed_chunks: list[str]
-    pending_chunks: list[str]
+    # Always written as [] (everything not completed is pending); read from legacy checkpoints.
+    # Keep the key: older versions require it and fail to load checkpoints without it.
+    pending_chunks: list[str] = Field(default_factory=list)
+    total_chunks: int = 0  # 0 in legacy checkpoints, which list pending_chunks instead
     partial_results: list[dict] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
 
 
+# Encodes straight to UTF-8 bytes in pydantic-core, skipping the str round trip.
+# Benchmarked faster than orjson.dumps(checkpoint.model_dump()), which has to
+# build the intermediate dicts in Python first.
+#
+# Checkpoints stay JSON rather than msgpack/CBOR: a binary encoder needs
+# model_dump() dicts for every result on every save, which the fragment cache
+# in CheckpointManager avoids, and an optional encoder would make a session's
+# checkpoint unreadable on a machine without that package installed.
+# They are not compressed either (zstd would be another optional package; stdlib
+# zlib level 1 costs about as much per MB as the whole write plus sync, so it
+# only pays off on slow disks).
+_CHECKPOINT_ADAPTER = TypeAdapter(Checkpoint)
+_RESULT_ADAPTER = TypeAdapter(ChunkResult)
+
+# Buffer size for checkpoint writes; batches the many small result fragments
+# into few write() syscalls.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# fdatasync skips the metadata-only flush where available (not on macOS/Windows)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _write_checkpoint_file(
+    path: Path, header: bytes, fragments: list[bytes], durable: bool = True
+) -> int:
+    """Stream a checkpoint document to disk without joining it in memory.
+
+    Args:
+        path: File to write (the temp file of the atomic save).
+        header: Encoded checkpoint without partial_results (a complete JSON object).
+        fragments: Encoded partial_results entries.
+        durable: If True, flush the data to stable storage before returning.
+
+    Returns:
+        Number of bytes written.
+    """
+    size = 0
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        size += f.write(header[:-1])
+        size += f.write(b',"partial_results":[')
+        for i, fragment in enumerate(fragments):
+            if i:
+                size += f.write(b",")
+            size += f.write(fragment)
+        size += f.write(b"]}")
+        if durable:
+            f.flush()
+            _fdatasync(f.fileno())
+    return size
+
+
+def _loads_checkpoint(data: bytes) -> dict:
+    """Parse checkpoint JSON bytes, preferring orjson when installed.
+
+    Files with a run of 19 or more digits go to json: orjson silently reads
+    integers wider than 64 bits as floats, where json returns the exact int.
+
+    Args:
+        data: Raw checkpoint file content.
+
+    Returns:
+        Decoded JSON document.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if _ORJSON_AVAILABLE and not _WIDE_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Retry with json: it also accepts NaN/Infinity
+    return json.loads(data)
+
+
 class CheckpointManager:
     """Manages checkpoints for session recovery.
 
@@ -94,7 +187,7 @@ class CheckpointManager:
             ValueError: If session_hash contains invalid characters or path traversal.
         """
         # SECURITY: Validate session_hash to prevent path traversal
-        if not SESSION_HASH_PATTERN.match(session_hash):
+        if not SESSION_HASH_PATTERN.fullmatch(session_hash):
             raise ValueError(
                 f"Invalid session_hash: must be alphanumeric with hyphens/underscores only, "
                 f"got: {session_hash!r}"
@@ -102,10 +195,11 @@ class CheckpointManager:
         if ".." in session_hash:
             raise ValueError("Invalid session_hash: path traversal not allowed")
 
-        self.cache_root = cache_root or (Path.home() / ".claude" / "cache" / "deepscan")
+        self.cache_root = cache_root or DEFAULT_CACHE_ROOT
         self.cache_dir = self.cache_root / session_hash
 
-        # SECURITY: Additional path traversal check after resolution
+        # SECURITY: Additional path traversal check after resolution. Not redundant with
+        # the pattern check: a symlink named like a valid hash can point outside cache_root.
         try:
             resolved = self.cache_dir.resolve()
             resolved.relative_to(self.cache_root.resolve())
@@ -115,6 +209,77 @@ class CheckpointManager:
             ) from err
 
         self.checkpoint_file = self.cache_dir / "checkpoint.json"
+        # Previous generation, kept by save_checkpoint and used if the current one is corrupt
+        self.previous_file = self.cache_dir / "checkpoint.json.prev"
+
+        # Serialized partial_results entries from the previous save, keyed by chunk_id.
+        # Each entry keeps the ChunkResult it was built from; a hit requires the very
+        # same object, so replacing a result (as the map loop does) invalidates it.
+        self._result_cache: dict[str, tuple[ChunkResult, dict, bytes]] = {}
+
+        # (save key, result fragments, checkpoint) of the last save that reached disk
+        self._last_saved: tuple[tuple, list[bytes], Checkpoint] | None = None
+
+        # Single writer thread for background saves (created on first use) and the
+        # save it is running; every save, load and clear waits for it first.
+        self._writer: ThreadPoolExecutor | None = None
+        self._pending_write: Future | None = None
+
+    def _serialize_results(self, results: list[ChunkResult]) -> tuple[list[dict], list[bytes]]:
+        """Dump and JSON-encode results, reusing entries from the previous save.
+
+        Only results that were added or replaced since the last call are
+        serialized again. Entries for chunk_ids no longer in results are dropped.
+        Reuse is decided by identity, so results must never be mutated in place
+        (see ChunkResult).
+
+        Args:
+            results: Current state.results.
+
+        Returns:
+            Tuple of (result dicts, encoded JSON fragments), in results order.
+        """
+        cache: dict[str, tuple[ChunkResult, dict, bytes]] = {}
+        dumped = []
+        fragments = []
+        for result in results:
+            entry = self._result_cache.get(result.chunk_id)
+            if entry is None or entry[0] is not result:
+                # Default-valued fields are omitted; model_validate() fills them back in
+                entry = (
+                    result,
+                    result.model_dump(exclude_defaults=True),
+                    _RESULT_ADAPTER.dump_json(result, exclude_defaults=True),
+                )
+            cache[result.chunk_id] = entry
+            dumped.append(entry[1])
+            fragments.append(entry[2])
+        self._result_cache = cache
+        return dumped, fragments
+
+    def _unchanged_since_last_save(self, save_key: tuple, fragments: list[bytes]) -> bool:
+        """Check whether a save would rewrite the checkpoint already on disk.
+
+        Fragments are compared by identity: the result cache hands back the same
+        bytes object for an unchanged result, and _last_saved keeps the previous
+        ones alive, so no content hashing is needed.
+
+        Args:
+            save_key: Tuple of every non-volatile Checkpoint field except results.
+            fragments: Encoded partial_results entries for this save.
+
+        Returns:
+            True if the last successful save had the same content.
+        """
+        if self._last_saved is None:
+            return False
+        last_key, last_fragments, _ = self._last_saved
+        return (
+            last_key == save_key
+            and len(last_fragments) == len(fragments)
+            and all(a is b for a, b in zip(last_fragments, fragments))
+            and self.checkpoint_file.exists()
+        )
 
     def save_checkpoint(
         self,
@@ -123,55 +288,126 @@ class CheckpointManager:
         cancel_mgr: CancellationManager | None = None,
         max_retries: int = 3,
         retry_delay: float = 0.1,
+        durable: bool = True,
+        background: bool = False,
     ) -> Checkpoint:
         """Save checkpoint after batch completion.
 
         Atomic write: writes to temp file, then renames.
         Includes Windows retry loop for file locking issues (Issue N Fix).
 
+        The checkpoint content is always captured on the calling thread. With
+        background=True only the file write, sync and rename run on a writer
+        thread; the interpreter waits for it at exit.
+
         Args:
             state: Current DeepScan state.
             batch_index: Index of completed batch.
             cancel_mgr: Optional CancellationManager for cancellation checks.
             max_retries: Maximum retry attempts for Windows file locking.
             retry_delay: Delay between retries in seconds.
+            durable: If True, sync the temp file to disk before the rename so a
+                crash cannot leave a renamed but empty or truncated checkpoint.
+            background: If True, return before the file is written. Write errors
+                are then logged by wait_for_pending_write() instead of raised.
 
         Returns:
-            Created Checkpoint object.
+            Created Checkpoint object, or the previously saved one if nothing
+            changed since the last successful save (the file is left as is).
 
         Raises:
             PermissionError: If write fails after all retries.
         """
-        # Collect completed and pending chunk IDs
+        # Strict ordering: the previous background save finishes first
+        self.wait_for_pending_write()
+
+        # Collect completed chunk IDs; pending ones are derived from total_chunks
         completed_chunks = [c.chunk_id for c in state.chunks if c.status == "completed"]
-        pending_chunks = [c.chunk_id for c in state.chunks if c.status == "pending"]
+        pending_count = len(state.chunks) - len(completed_chunks)
+
+        # Convert results to dict for serialization (cached across saves)
+        partial_results, result_fragments = self._serialize_results(state.results)
 
-        # Convert results to dict for serialization
-        partial_results = [r.model_dump() for r in state.results]
+        # Skip the write (and its sync) if nothing changed since the last save
+        save_key = (state.session_id, state.phase, batch_index, completed_chunks, len(state.chunks))
+        if self._unchanged_since_last_save(save_key, result_fragments):
+            logger.debug("Checkpoint unchanged since last save, skipping write")
+            return self._last_saved[2]
 
+        # One clock read, so checkpoint_id and created_at always agree
+        now = datetime.now()
         checkpoint = Checkpoint(
-            checkpoint_id=f"cp_{int(time.time())}",
+            checkpoint_id=f"cp_{int(now.timestamp())}",
             session_id=state.session_id,
             phase=state.phase,
             batch_index=batch_index,
             completed_chunks=completed_chunks,
-            pending_chunks=pending_chunks,
+            total_chunks=len(state.chunks),
             partial_results=partial_results,
-            created_at=datetime.now(),
+            created_at=now,
         )
 
+        write_args = (
+            checkpoint,
+            save_key,
+            result_fragments,
+            pending_count,
+            cancel_mgr,
+            max_retries,
+            retry_delay,
+            durable,
+        )
+        if background:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="CheckpointWriter"
+                )
+            self._pending_write = self._writer.submit(self._write_checkpoint, *write_args)
+        else:
+            self._write_checkpoint(*write_args)
+        return checkpoint
+
+    def _write_checkpoint(
+        self,
+        checkpoint: Checkpoint,
+        save_key: tuple,
+        result_fragments: list[bytes],
+        pending_count: int,
+        cancel_mgr: CancellationManager | None,
+        max_retries: int,
+        retry_delay: float,
+        durable: bool,
+    ) -> None:
+        """Write checkpoint to disk atomically (body of save_checkpoint).
+
+        Args:
+            checkpoint: Checkpoint to write (partial_results taken from result_fragments).
+            save_key: Recorded in _last_saved once the file is in place.
+            result_fragments: Encoded partial_results entries.
+            pending_count: Number of pending chunks, for telemetry.
+            cancel_mgr: Optional CancellationManager for cancellation checks.
+            max_retries: Maximum retry attempts for Windows file locking.
+            retry_delay: Delay between retries in seconds.
+            durable: If True, sync the temp file to disk before the rename.
+
+        Raises:
+            PermissionError: If write fails after all retries.
+        """
+        completed_count = len(checkpoint.completed_chunks)
+
         # Atomic write with Windows retry (Issue N Fix)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         tmp_file = self.checkpoint_file.with_suffix(".json.tmp")
-        checkpoint_json = checkpoint.model_dump_json(indent=2)
-        tmp_file.write_text(checkpoint_json, encoding="utf-8")
+        # Compact output: indentation added ~40% to the file size and encode time.
+        # partial_results is streamed from the cached fragments as the last key.
+        header = _CHECKPOINT_ADAPTER.dump_json(checkpoint, exclude={"partial_results"})
+        checkpoint_size = _write_checkpoint_file(tmp_file, header, result_fragments, durable)
 
         # Telemetry: Log checkpoint size for monitoring
-        checkpoint_size = len(checkpoint_json.encode("utf-8"))
         logger.debug(
             f"Saving checkpoint: {checkpoint_size} bytes "
-            f"({checkpoint_size / 1024:.1f} KB, {len(completed_chunks)} completed, "
-            f"{len(pending_chunks)} pending)"
+            f"({checkpoint_size / 1024:.1f} KB, {completed_count} completed, "
+            f"{pending_count} pending)"
         )
 
         # Warn if checkpoint exceeds recommended write size (asymmetric limit)
@@ -182,6 +418,8 @@ class CheckpointManager:
                 f"Consider reducing partial_results or completed_chunks."
             )
 
+        self._link_previous_checkpoint()
+
         # Retry loop for Windows file locking issues
         for attempt in range(max_retries):
             # IMPORTANT: Only abort on Force Quit, not Graceful Cancellation!
@@ -194,14 +432,15 @@ class CheckpointManager:
                 except Exception:
                     pass
                 logger.warning("Checkpoint save interrupted by Force Quit")
-                # Still return checkpoint even if not saved to file
-                return checkpoint
+                # save_checkpoint still returns the checkpoint even if not saved to file
+                return
 
             try:
                 # os.replace is atomic on POSIX and mostly atomic on Windows
                 os.replace(str(tmp_file), str(self.checkpoint_file))
+                self._last_saved = (save_key, result_fragments, checkpoint)
                 logger.debug(f"Checkpoint saved: {checkpoint.checkpoint_id}")
-                return checkpoint
+                return
 
             except PermissionError as e:
                 if attempt < max_retries - 1:
@@ -219,55 +458,113 @@ class CheckpointManager:
                     logger.error(f"Failed to save checkpoint after {max_retries} attempts: {e}")
                     raise
 
-        return checkpoint
+    def wait_for_pending_write(self) -> None:
+        """Block until a background save started by save_checkpoint has finished.
+
+        A failure of that save is logged rather than raised, since the caller
+        that started it has already moved on.
+        """
+        future, self._pending_write = self._pending_write, None
+        if future is None:
+            return
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Background checkpoint save failed: {type(e).__name__}: {e}")
+
+    def _link_previous_checkpoint(self) -> None:
+        """Hard-link the checkpoint about to be replaced to previous_file.
+
+        The link shares the old file's data, so keeping it costs no copy. Best
+        effort: failures (no checkpoint yet, no hard-link support) are ignored.
+        """
+        try:
+            self.previous_file.unlink(missing_ok=True)
+            os.link(self.checkpoint_file, self.previous_file)
+        except OSError as e:
+            logger.debug(f"Previous checkpoint not kept: {type(e).__name__}: {e}")
 
     def load_checkpoint(self) -> Checkpoint | None:
         """Load existing checkpoint if available.
 
+        Falls back to the previous generation if the current file cannot be parsed.
+
         Returns:
             Checkpoint object if exists, None otherwise.
         """
+        self.wait_for_pending_write()
         try:
-            if not self.checkpoint_file.exists():
-                return None
-
-            # SECURITY: Check file size before reading to prevent DoS
-            # Uses asymmetric limits for backward compatibility:
-            # - READ limit (100MB): Allows loading legacy checkpoints
-            # - WRITE limit (20MB): Used for "over recommended" warning
-            file_size = self.checkpoint_file.stat().st_size
-
-            if file_size > MAX_CHECKPOINT_READ_SIZE:
-                # Absolute limit - file too large even for legacy support
-                logger.error(
-                    f"Checkpoint file exceeds maximum read limit: {file_size} bytes "
-                    f"(max {MAX_CHECKPOINT_READ_SIZE}). Cannot load - data may be corrupted."
-                )
-                raise CheckpointTooLargeError(
-                    f"Checkpoint file too large: {file_size} bytes exceeds "
-                    f"{MAX_CHECKPOINT_READ_SIZE} byte limit"
-                )
-
-            if file_size > MAX_CHECKPOINT_WRITE_SIZE:
-                # Legacy checkpoint - load with warning
-                logger.warning(
-                    f"Loading legacy checkpoint: {file_size} bytes exceeds recommended "
-                    f"limit of {MAX_CHECKPOINT_WRITE_SIZE} bytes. Consider pruning results."
-                )
-
-            # Telemetry: Log checkpoint size for monitoring
-            logger.debug(
-                f"Loading checkpoint: {file_size} bytes "
-                f"({file_size / 1024:.1f} KB, {file_size / MAX_CHECKPOINT_WRITE_SIZE * 100:.1f}% of write limit)"
-            )
-
-            data = json.loads(self.checkpoint_file.read_text(encoding="utf-8"))
-            return Checkpoint.model_validate(data)
+            return self._read_checkpoint(self.checkpoint_file)
         except FileNotFoundError:
             return None
         except (json.JSONDecodeError, ValueError, OSError) as e:
             logger.warning(f"Failed to load checkpoint: {type(e).__name__}: {e}")
+
+        try:
+            checkpoint = self._read_checkpoint(self.previous_file)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, ValueError, OSError) as e:
+            logger.warning(f"Failed to load previous checkpoint: {type(e).__name__}: {e}")
             return None
+        logger.warning(f"Loaded previous checkpoint instead: {checkpoint.checkpoint_id}")
+        return checkpoint
+
+    def _read_checkpoint(self, path: Path) -> Checkpoint:
+        """Read and validate one checkpoint file.
+
+        Args:
+            path: Checkpoint file to read.
+
+        Returns:
+            Validated Checkpoint.
+
+        Raises:
+            CheckpointTooLargeError: If the file exceeds MAX_CHECKPOINT_READ_SIZE.
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+            ValueError: If the content does not validate as a Checkpoint.
+        """
+        # SECURITY: Check file size before reading to prevent DoS
+        # Uses asymmetric limits for backward compatibility:
+        # - READ limit (100MB): Allows loading legacy checkpoints
+        # - WRITE limit (20MB): Used for "over recommended" warning
+        file_size = path.stat().st_size
+
+        if file_size > MAX_CHECKPOINT_READ_SIZE:
+            # Absolute limit - file too large even for legacy support
+            logger.error(
+                f"Checkpoint file exceeds maximum read limit: {file_size} bytes "
+                f"(max {MAX_CHECKPOINT_READ_SIZE}). Cannot load - data may be corrupted."
+            )
+            raise CheckpointTooLargeError(
+                f"Checkpoint file too large: {file_size} bytes exceeds "
+                f"{MAX_CHECKPOINT_READ_SIZE} byte limit"
+            )
+
+        if file_size > MAX_CHECKPOINT_WRITE_SIZE:
+            # Legacy checkpoint - load with warning
+            logger.warning(
+                f"Loading legacy checkpoint: {file_size} bytes exceeds recommended "
+                f"limit of {MAX_CHECKPOINT_WRITE_SIZE} bytes. Consider pruning results."
+            )
+
+        # Telemetry: Log checkpoint size for monitoring
+        logger.debug(
+            f"Loading checkpoint: {file_size} bytes "
+            f"({file_size / 1024:.1f} KB, {file_size / MAX_CHECKPOINT_WRITE_SIZE * 100:.1f}% of write limit)"
+        )
+
+        # SECURITY: Bounded read, the file may have grown since stat()
+        with open(path, "rb") as f:
+            raw = f.read(MAX_CHECKPOINT_READ_SIZE + 1)
+        if len(raw) > MAX_CHECKPOINT_READ_SIZE:
+            raise CheckpointTooLargeError(
+                f"Checkpoint file grew past the {MAX_CHECKPOINT_READ_SIZE} byte limit while reading"
+            )
+
+        data = _loads_checkpoint(raw)
+        return Checkpoint.model_validate(data)
 
     def clear_checkpoint(self) -> bool:
         """Clear checkpoint after successful completion.
@@ -275,6 +572,10 @@ class CheckpointManager:
         Returns:
             True if checkpoint was deleted, False if not found.
         """
+        self.wait_for_pending_write()
+        self._result_cache.clear()
+        self._last_saved = None
+        self.previous_file.unlink(missing_ok=True)
         if self.checkpoint_file.exists():
             self.checkpoint_file.unlink()
             return True
@@ -286,6 +587,7 @@ class CheckpointManager:
         Returns:
             True if checkpoint file exists.
         """
+        self.wait_for_pending_write()
         return self.checkpoint_file.exists()
 
     def get_checkpoint_info(self) -> dict | None:
@@ -304,7 +606,11 @@ class CheckpointManager:
             "phase": checkpoint.phase,
             "batch_index": checkpoint.batch_index,
             "completed_count": len(checkpoint.completed_chunks),
-            "pending_count": len(checkpoint.pending_chunks),
+            "pending_count": (
+                checkpoint.total_chunks - len(checkpoint.completed_chunks)
+                if checkpoint.total_chunks
+                else len(checkpoint.pending_chunks)
+            ),
             "created_at": checkpoint.created_at.isoformat(),
         }
 
@@ -321,11 +627,11 @@ def restore_state_from_checkpoint(
         state: DeepScanState to update.
         checkpoint: Checkpoint to restore from.
     """
-    # Mark completed chunks
-    for chunk_id in checkpoint.completed_chunks:
-        for chunk in state.chunks:
-            if chunk.chunk_id == chunk_id:
-                chunk.status = "completed"
+    # Mark completed chunks (one pass over each list, not a scan per chunk_id)
+    completed_ids = set(checkpoint.completed_chunks)
+    for chunk in state.chunks:
+        if chunk.chunk_id in completed_ids:
+            chunk.status = "completed"
 
     # Restore phase and results
     state.phase = checkpoint.phase
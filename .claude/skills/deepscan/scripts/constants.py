@@ -218,6 +218,28 @@ CHUNK_SIZE_BY_EXTENSION: dict[str, int] = {
 
 DEFAULT_CHUNK_SIZE = 150_000
 
+# Content category reported by detect_content_type(). Extensions with a chunk size
+# but no category here (e.g. ".h", ".sql") are reported as "other".
+_EXTENSION_CATEGORY: dict[str, str] = {
+    ext: category
+    for category, extensions in (
+        ("code", (".py", ".java", ".ts", ".tsx", ".js", ".jsx", ".go", ".rs", ".c", ".cpp")),
+        ("config", (".json", ".yaml", ".yml", ".toml", ".xml")),
+        ("docs", (".md", ".txt", ".rst", ".html")),
+    )
+    for ext in extensions
+}
+
+# Lowercase extension -> (category, chunk size), merged once so lookup is a single get()
+_EXTENSION_PROFILE: dict[str, tuple[str, int]] = {
+    ext: (
+        _EXTENSION_CATEGORY.get(ext, "other"),
+        CHUNK_SIZE_BY_EXTENSION.get(ext, DEFAULT_CHUNK_SIZE),
+    )
+    for ext in CHUNK_SIZE_BY_EXTENSION.keys() | _EXTENSION_CATEGORY.keys()
+}
+_OTHER_PROFILE = ("other", DEFAULT_CHUNK_SIZE)
+
 # =============================================================================
 # Progress Tracking
 # =============================================================================
@@ -329,30 +351,15 @@ def detect_content_type(path: Path, file_extensions: Iterable[str]) -> tuple[str
     Returns:
         Tuple of (content_type_description, recommended_chunk_size).
     """
-    # Convert to list to support both set and list inputs
-    ext_list = list(file_extensions) if file_extensions else []
-    if not ext_list:
+    # Count extensions straight from the iterable (list, set, generator, ...)
+    ext_counts = Counter(file_extensions or ())
+    if not ext_counts:
         return ("unknown", DEFAULT_CHUNK_SIZE)
 
-    # Count extensions (Counter works with list, counting occurrences)
-    ext_counts = Counter(ext_list)
-    dominant_ext, count = ext_counts.most_common(1)[0]
-
-    # Get chunk size for dominant extension
-    chunk_size = CHUNK_SIZE_BY_EXTENSION.get(dominant_ext.lower(), DEFAULT_CHUNK_SIZE)
-
-    # Determine content type category
-    code_extensions = {".py", ".java", ".ts", ".tsx", ".js", ".jsx", ".go", ".rs", ".c", ".cpp"}
-    config_extensions = {".json", ".yaml", ".yml", ".toml", ".xml"}
-    doc_extensions = {".md", ".txt", ".rst", ".html"}
+    # max() keeps most_common(1)'s tie-break (first seen wins) without sorting
+    dominant_ext = max(ext_counts, key=ext_counts.__getitem__)
 
-    if dominant_ext.lower() in code_extensions:
-        content_type = f"code:{dominant_ext}"
-    elif dominant_ext.lower() in config_extensions:
-        content_type = f"config:{dominant_ext}"
-    elif dominant_ext.lower() in doc_extensions:
-        content_type = f"docs:{dominant_ext}"
-    else:
-        content_type = f"other:{dominant_ext}"
+    # Category and chunk size for dominant extension
+    category, chunk_size = _EXTENSION_PROFILE.get(dominant_ext.lower(), _OTHER_PROFILE)
 
-    return (content_type, chunk_size)
+    return (f"{category}:{dominant_ext}", chunk_size)
@@ -43,6 +43,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import ast
 import json
 import re
 import sys
@@ -71,6 +72,14 @@ from models import (
     SESSION_HASH_PATTERN,
 )
 
+# Optional orjson import (faster export-results encoding, falls back to json)
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 # =============================================================================
 # Phase 7: Security & Performance Hardening
 # =============================================================================
@@ -172,6 +181,111 @@ __all__ = [
 ]
 
 
+# =============================================================================
+# REPL Sandbox Validation
+# =============================================================================
+
+# Layer 1: Forbidden pattern check (see docs/SECURITY.md)
+FORBIDDEN_PATTERNS = (
+    r"__import__",
+    r"exec\s*\(",
+    r"eval\s*\(",
+    r"compile\s*\(",
+    r"open\s*\(",
+    r"os\.",
+    r"subprocess",
+    r"sys\.",  # FIX: Added missing pattern (prevents sys.exit, sys.modules)
+    r"__globals__",
+    r"__class__",
+    r"__bases__",
+    r"__closure__",  # FIX: Prevent closure introspection
+    r"getattr\s*\(",
+    r"setattr\s*\(",
+    r"delattr\s*\(",  # FIX: Added missing pattern
+)
+
+# Single alternation so clean code is screened in one scan instead of one per pattern.
+# On a hit, the error names the first listed pattern that matches (same as the
+# per-pattern loop this replaces), not whichever alternative matched leftmost.
+_FORBIDDEN_RE = re.compile("|".join(f"(?:{p})" for p in FORBIDDEN_PATTERNS))
+
+# Layer 2: AST node whitelist
+# P2-FIX: Strengthened AST whitelist - explicit DENY of dangerous nodes
+# BLOCKED (not in whitelist): FunctionDef, ClassDef, AsyncFunctionDef,
+# Import, ImportFrom, Global, Nonlocal, Yield, YieldFrom, Await, Try, Raise,
+# With, Assert, Match
+# P7-FIX: Allow comprehensions and lambda for practical analysis
+ALLOWED_NODE_TYPES: frozenset[type[ast.AST]] = frozenset({
+    ast.Module,
+    ast.Expr,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Store,  # FIX-CVE-2026-001: CRITICAL - Enable variable assignment
+    ast.Del,  # FIX-CVE-2026-001: CRITICAL - Enable deletion
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Subscript,
+    ast.List,
+    ast.Tuple,
+    ast.Dict,
+    ast.Assign,
+    ast.AugAssign,  # FIX: Enable +=, -=, etc.
+    ast.For,
+    ast.If,
+    ast.IfExp,  # D4-FIX: Ternary expressions (x if y else z) - safe for analysis
+    ast.Pass,
+    ast.Attribute,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Mod,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.Gt,
+    ast.LtE,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.And,
+    ast.Or,
+    ast.Not,
+    # P8-FIX: Removed ast.Index (deprecated since Python 3.9, project requires 3.10+)
+    # P7-FIX: Comprehensions (ast.walk checks nested nodes recursively)
+    ast.ListComp,       # [x for x in y]
+    ast.DictComp,       # {k: v for k, v in items}
+    ast.SetComp,        # {x for x in y}
+    ast.GeneratorExp,   # (x for x in y)
+    ast.comprehension,  # for loop part of comprehensions
+    # P7-FIX: Lambda expressions
+    ast.Lambda,         # lambda x: x
+    ast.arguments,      # lambda parameter list
+    ast.arg,            # single parameter
+    # P7-FIX: Keyword arguments in function calls
+    ast.keyword,        # func(key=value)
+    # P8-FIX: f-strings (Issue 2 from deepscan_errors_20260124.md)
+    # SECURITY NOTE: ast.walk() recursively validates contents inside {}.
+    # Dangerous code like f"{__import__('os')}" is blocked by existing
+    # Attribute checks (DANGEROUS_ATTRS below) that block dunder attributes,
+    # and FORBIDDEN_PATTERNS that block __import__.
+    ast.JoinedStr,      # f"hello {name}"
+    ast.FormattedValue, # the {name} part inside f-strings
+})
+
+# Layer 3: Block dunder attributes that could allow introspection escapes
+DANGEROUS_ATTRS: frozenset[str] = frozenset({
+    "__class__", "__bases__", "__subclasses__", "__mro__",
+    "__globals__", "__code__", "__closure__", "__func__",
+    "__self__", "__dict__", "__doc__", "__module__",
+    "__builtins__", "__import__", "__loader__", "__spec__",
+    "__annotations__", "__wrapped__", "__qualname__",
+})
+
+
 # =============================================================================
 # CLI Interface
 # =============================================================================
@@ -309,6 +423,15 @@ def cmd_status(_args: argparse.Namespace) -> int:
 
 def cmd_exec(args: argparse.Namespace) -> int:
     """Execute Python code in REPL context with sandboxing."""
+    code = args.code
+
+    # FIX-CVE-2026-003: Input length check to prevent ReDoS
+    # Checked before loading the session so oversized input is rejected without I/O.
+    MAX_CODE_LENGTH = 100_000  # 100KB
+    if len(code) > MAX_CODE_LENGTH:
+        print(f"[ERROR] Code too long: {len(code)} bytes (max {MAX_CODE_LENGTH})")
+        return 1
+
     # P0-FIX: Get current session hash first (matching cmd_status pattern)
     session_hash = StateManager.get_current_session_hash()
     if not session_hash:
@@ -333,113 +456,24 @@ def cmd_exec(args: argparse.Namespace) -> int:
         **helpers,
     }
 
-    code = args.code
-
-    # FIX-CVE-2026-003: Input length check to prevent ReDoS
-    MAX_CODE_LENGTH = 100_000  # 100KB
-    if len(code) > MAX_CODE_LENGTH:
-        print(f"[ERROR] Code too long: {len(code)} bytes (max {MAX_CODE_LENGTH})")
-        return 1
-
     # Layer 1: Forbidden pattern check
-    FORBIDDEN_PATTERNS = [
-        r"__import__",
-        r"exec\s*\(",
-        r"eval\s*\(",
-        r"compile\s*\(",
-        r"open\s*\(",
-        r"os\.",
-        r"subprocess",
-        r"sys\.",  # FIX: Added missing pattern (prevents sys.exit, sys.modules)
-        r"__globals__",
-        r"__class__",
-        r"__bases__",
-        r"__closure__",  # FIX: Prevent closure introspection
-        r"getattr\s*\(",
-        r"setattr\s*\(",
-        r"delattr\s*\(",  # FIX: Added missing pattern
-    ]
-
-    for pattern in FORBIDDEN_PATTERNS:
-        if re.search(pattern, code):
-            print(f"[ERROR] Forbidden pattern detected: {pattern}")
-            return 1
+    if _FORBIDDEN_RE.search(code):
+        pattern = next(p for p in FORBIDDEN_PATTERNS if re.search(p, code))
+        print(f"[ERROR] Forbidden pattern detected: {pattern}")
+        return 1
 
     # Layer 2: AST validation
-    import ast
-
     # SANDBOX_FIX: Initialize tree to None for reliable checking later
     tree: ast.Module | None = None
 
+    # P7-001 FIX: Determine if code uses helpers (requires main process execution)
+    # HELPER_DETECTION_FIX: Use module-level HELPER_NAMES constant (ensures sync with create_helpers)
+    # Detected during the validation walk below, so the tree is only traversed once.
+    uses_helpers = False
+
     try:
         tree = ast.parse(code, mode="exec")
 
-        # P2-FIX: Strengthened AST whitelist - explicit DENY of dangerous nodes
-        # BLOCKED (not in whitelist): FunctionDef, ClassDef, AsyncFunctionDef,
-        # Import, ImportFrom, Global, Nonlocal, Yield, YieldFrom, Await, Try, Raise,
-        # With, Assert, Match
-        # P7-FIX: Allow comprehensions and lambda for practical analysis
-        ALLOWED_NODE_TYPES = {
-            ast.Module,
-            ast.Expr,
-            ast.Call,
-            ast.Name,
-            ast.Load,
-            ast.Store,  # FIX-CVE-2026-001: CRITICAL - Enable variable assignment
-            ast.Del,  # FIX-CVE-2026-001: CRITICAL - Enable deletion
-            ast.Constant,
-            ast.BinOp,
-            ast.UnaryOp,
-            ast.Compare,
-            ast.Subscript,
-            ast.List,
-            ast.Tuple,
-            ast.Dict,
-            ast.Assign,
-            ast.AugAssign,  # FIX: Enable +=, -=, etc.
-            ast.For,
-            ast.If,
-            ast.IfExp,  # D4-FIX: Ternary expressions (x if y else z) - safe for analysis
-            ast.Pass,
-            ast.Attribute,
-            ast.Add,
-            ast.Sub,
-            ast.Mult,
-            ast.Div,
-            ast.Mod,
-            ast.Eq,
-            ast.NotEq,
-            ast.Lt,
-            ast.Gt,
-            ast.LtE,
-            ast.GtE,
-            ast.In,
-            ast.NotIn,
-            ast.And,
-            ast.Or,
-            ast.Not,
-            # P8-FIX: Removed ast.Index (deprecated since Python 3.9, project requires 3.10+)
-            # P7-FIX: Comprehensions (ast.walk checks nested nodes recursively)
-            ast.ListComp,       # [x for x in y]
-            ast.DictComp,       # {k: v for k, v in items}
-            ast.SetComp,        # {x for x in y}
-            ast.GeneratorExp,   # (x for x in y)
-            ast.comprehension,  # for loop part of comprehensions
-            # P7-FIX: Lambda expressions
-            ast.Lambda,         # lambda x: x
-            ast.arguments,      # lambda parameter list
-            ast.arg,            # single parameter
-            # P7-FIX: Keyword arguments in function calls
-            ast.keyword,        # func(key=value)
-            # P8-FIX: f-strings (Issue 2 from deepscan_errors_20260124.md)
-            # SECURITY NOTE: ast.walk() recursively validates contents inside {}.
-            # Dangerous code like f"{__import__('os')}" is blocked by existing
-            # Attribute checks (lines 425-436) that block dunder attributes,
-            # and FORBIDDEN_PATTERNS that block __import__.
-            ast.JoinedStr,      # f"hello {name}"
-            ast.FormattedValue, # the {name} part inside f-strings
-        }
-
         # TYPE_NARROWING: Assert tree is not None (guaranteed by successful ast.parse above)
         assert tree is not None
         for node in ast.walk(tree):
@@ -447,33 +481,22 @@ def cmd_exec(args: argparse.Namespace) -> int:
                 print(f"[ERROR] Forbidden AST node: {type(node).__name__}")
                 return 1
 
+            # Whitelisted types are exact (no subclasses), so identity checks
+            # are equivalent to isinstance() and cheaper per node.
+            if type(node) is ast.Name:
+                if node.id in HELPER_NAMES:
+                    uses_helpers = True
             # P2-FIX: Enhanced dangerous attribute access blocking
-            if isinstance(node, ast.Attribute):
-                # Block dunder attributes that could allow introspection escapes
-                DANGEROUS_ATTRS = {
-                    "__class__", "__bases__", "__subclasses__", "__mro__",
-                    "__globals__", "__code__", "__closure__", "__func__",
-                    "__self__", "__dict__", "__doc__", "__module__",
-                    "__builtins__", "__import__", "__loader__", "__spec__",
-                    "__annotations__", "__wrapped__", "__qualname__",
-                }
-                if node.attr.startswith("_") or node.attr in DANGEROUS_ATTRS:
-                    print(f"[ERROR] Forbidden attribute: {node.attr}")
-                    return 1
+            elif type(node) is ast.Attribute and (
+                node.attr.startswith("_") or node.attr in DANGEROUS_ATTRS
+            ):
+                print(f"[ERROR] Forbidden attribute: {node.attr}")
+                return 1
     except SyntaxError as e:
         # P8-FIX: Handle SyntaxError explicitly instead of swallowing
         print(f"[ERROR] Invalid Python syntax: {e}")
         return 1
 
-    # P7-001 FIX: Determine if code uses helpers (requires main process execution)
-    # HELPER_DETECTION_FIX: Use module-level HELPER_NAMES constant (ensures sync with create_helpers)
-    # SANDBOX_FIX: Use explicit None check instead of "tree" in dir() (unreliable)
-    uses_helpers = (
-        any(isinstance(node, ast.Name) and node.id in HELPER_NAMES for node in ast.walk(tree))
-        if tree is not None
-        else False
-    )
-
     # P8-FIX: Calculate appropriate timeout
     # Priority: 1) CLI-provided timeout, 2) auto-detect for I/O-heavy operations, 3) default
     cli_timeout = getattr(args, "timeout", None)
@@ -540,6 +563,78 @@ def cmd_reset(_args: argparse.Namespace) -> int:
     return 0
 
 
+def _dumps_export(value: object) -> bytes:
+    """Encode part of the export-results document as indented JSON bytes.
+
+    Uses orjson when installed. Datetimes are passed through to ``default=str``
+    so they render as they do with json (``2026-01-24 10:00:00``). orjson writes
+    non-ASCII text as UTF-8 instead of ``\\u`` escapes, spells some floats
+    differently (``0.00001`` vs ``1e-05``) and writes NaN/Infinity as null.
+    Values orjson rejects, such as integers wider than 64 bits, fall back to json.
+
+    Args:
+        value: JSON-compatible value to encode.
+
+    Returns:
+        UTF-8 encoded JSON, indented as if at the top level.
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, indent=2, default=str).encode("utf-8")
+
+
+def _write_export(out_path: Path, state: DeepScanState) -> None:
+    """Stream the export-results document to out_path.
+
+    Results are dumped and encoded one at a time instead of building the whole
+    payload and its encoded form in memory. Each part is encoded with
+    _dumps_export and shifted right to its nesting depth, which gives the same
+    layout as encoding the full document at once (encoded JSON never contains a
+    raw newline inside a string, so every newline is an indentation point).
+
+    The document is streamed into "<out_path>.tmp" and moved over out_path only
+    once complete, so a failure part way through never leaves a truncated file.
+
+    Args:
+        out_path: Destination file.
+        state: Loaded session state to export.
+    """
+    fields: dict[str, object] = {
+        "session_id": state.session_id,
+        "query": state.query,
+        "results": state.results,
+        "buffers": state.buffers,
+        "final_answer": state.final_answer,
+    }
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            for i, (key, value) in enumerate(fields.items()):
+                f.write(b"{\n  " if i == 0 else b",\n  ")
+                f.write(_dumps_export(key) + b": ")
+                if key == "results" and state.results:
+                    f.write(b"[\n    ")
+                    for j, result in enumerate(state.results):
+                        if j:
+                            f.write(b",\n    ")
+                        f.write(_dumps_export(result.model_dump()).replace(b"\n", b"\n    "))
+                    f.write(b"\n  ]")
+                else:
+                    f.write(_dumps_export(value).replace(b"\n", b"\n  "))
+            f.write(b"\n}")
+        os.replace(tmp_path, out_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def cmd_export_results(args: argparse.Namespace) -> int:
     """Export results to file."""
     # P0-FIX: Get current session hash first (matching cmd_status pattern)
@@ -556,16 +651,8 @@ def cmd_export_results(args: argparse.Namespace) -> int:
         print(f"[ERROR] {e}")
         return 1
 
-    output = {
-        "session_id": state.session_id,
-        "query": state.query,
-        "results": [r.model_dump() for r in state.results],
-        "buffers": state.buffers,
-        "final_answer": state.final_answer,
-    }
-
     out_path = Path(args.output_path)
-    out_path.write_text(json.dumps(output, indent=2, default=str), encoding="utf-8")
+    _write_export(out_path, state)
     print(f"[OK] Results exported to {out_path}")
     return 0
 
@@ -588,9 +675,13 @@ def cmd_list(_args: argparse.Namespace) -> int:
     print(f"{'Hash':<45} {'Phase':<12} {'Progress':<10} {'Modified'}")
     print("-" * 90)
 
-    for s in sessions:
-        modified_str = s["modified"].strftime("%Y-%m-%d %H:%M")
-        print(f"{s['hash']:<45} {s['phase']:<12} {s['progress']:.1f}%{'':<5} {modified_str}")
+    # One write for the whole table instead of one print() per session
+    rows = [
+        f"{s['hash']:<45} {s['phase']:<12} {s['progress']:.1f}%{'':<5} "
+        f"{s['modified']:%Y-%m-%d %H:%M}"
+        for s in sessions
+    ]
+    print("\n".join(rows))
 
     # Show current session
     current = StateManager.get_current_session_hash()
@@ -780,125 +871,130 @@ def process_map_phase(
 
     # Process in batches (with ProgressWriter context)
     with progress_writer:
-        for batch_start in range(0, total_chunks, batch_size):
-            # Phase 6: Check for cancellation before processing batch
-            if cancel_mgr and cancel_mgr.is_cancelled():
-                print("\n[CANCEL] Cancellation requested, saving progress...")
-                cancelled = True
-                break
-            batch_end = min(batch_start + batch_size, total_chunks)
-            batch_chunks = pending_chunks[batch_start:batch_end]
-            batch_num = (batch_start // batch_size) + 1
-            total_batches = (total_chunks + batch_size - 1) // batch_size
-
-            # P1-FIX: Emit batch start event for progress monitoring
-            progress_writer.emit_batch_start(batch_num, total_batches, len(batch_chunks))
-
-            print(f"[MAP] Processing batch {batch_num}/{total_batches} ({len(batch_chunks)} chunks)")
-
-            # Check if we should use sequential mode
-            if use_sequential:
-                batch_results = _process_batch_sequential(
-                    batch_chunks, state, manager, batch_start, total_chunks
-                )
-            else:
-                batch_results = _process_batch_parallel(
-                    batch_chunks, state, manager, batch_start, total_chunks, config.timeout_seconds
-                )
-
-            # Process batch results
-            batch_success = 0
-            batch_failed = 0
-            batch_placeholders = 0  # MEDIUM-3 FIX: Track placeholders per batch
-            for result in batch_results:
-                if result.get("status") == "failed":
-                    batch_failed += 1
-                    failed_count += 1
-                elif result.get("status") in ("placeholder", "pending"):
-                    # MEDIUM-3 FIX: Track placeholder results separately
-                    try:
-                        chunk_result = ChunkResult.model_validate(result)
-                        # HIGH-FIX: Remove existing placeholder/pending for this chunk (idempotent update)
-                        # Prevents duplicate results when re-running map
-                        state.results = [
-                            r for r in state.results
-                            if r.chunk_id != chunk_result.chunk_id or r.status not in ("placeholder", "pending")
-                        ]
-                        state.results.append(chunk_result)
-                        batch_placeholders += 1
-                        placeholder_count += 1
-                        processed_count += 1  # Still count as processed for progress
-                    except Exception as e:
-                        print(f"[WARN] Failed to validate placeholder result: {e}")
-                        failed_count += 1
-                        batch_failed += 1
+        try:
+            for batch_start in range(0, total_chunks, batch_size):
+                # Phase 6: Check for cancellation before processing batch
+                if cancel_mgr and cancel_mgr.is_cancelled():
+                    print("\n[CANCEL] Cancellation requested, saving progress...")
+                    cancelled = True
+                    break
+                batch_end = min(batch_start + batch_size, total_chunks)
+                batch_chunks = pending_chunks[batch_start:batch_end]
+                batch_num = (batch_start // batch_size) + 1
+                total_batches = (total_chunks + batch_size - 1) // batch_size
+
+                # P1-FIX: Emit batch start event for progress monitoring
+                progress_writer.emit_batch_start(batch_num, total_batches, len(batch_chunks))
+
+                print(f"[MAP] Processing batch {batch_num}/{total_batches} ({len(batch_chunks)} chunks)")
+
+                # Check if we should use sequential mode
+                if use_sequential:
+                    batch_results = _process_batch_sequential(
+                        batch_chunks, state, manager, batch_start, total_chunks
+                    )
                 else:
-                    # Add to state results (real analysis success)
-                    try:
-                        chunk_result = ChunkResult.model_validate(result)
-                        # HIGH-FIX: Remove ALL existing results for this chunk (idempotent update)
-                        # Real results should replace any prior result (placeholder, pending, OR failed)
-                        # This handles the --escalate retry scenario where failed → success
-                        # Without this, failed + success would coexist causing reduce phase confusion
-                        state.results = [
-                            r for r in state.results
-                            if r.chunk_id != chunk_result.chunk_id
-                        ]
-                        state.results.append(chunk_result)
-                        batch_success += 1
-                        processed_count += 1
-                        # P1-FIX: Emit chunk completion and findings
-                        progress_writer.emit_chunk_complete(
-                            chunk_result.chunk_id,
-                            len(chunk_result.findings),
-                            chunk_result.status  # P8-FIX: Use actual status instead of hardcoded "completed"
-                        )
-                        for finding in chunk_result.findings:
-                            # FIX: Use correct field names (point, confidence) from Finding model
-                            progress_writer.emit_finding(
+                    batch_results = _process_batch_parallel(
+                        batch_chunks, state, manager, batch_start, total_chunks, config.timeout_seconds
+                    )
+
+                # Process batch results
+                batch_success = 0
+                batch_failed = 0
+                batch_placeholders = 0  # MEDIUM-3 FIX: Track placeholders per batch
+                for result in batch_results:
+                    if result.get("status") == "failed":
+                        batch_failed += 1
+                        failed_count += 1
+                    elif result.get("status") in ("placeholder", "pending"):
+                        # MEDIUM-3 FIX: Track placeholder results separately
+                        try:
+                            chunk_result = ChunkResult.model_validate(result)
+                            # HIGH-FIX: Remove existing placeholder/pending for this chunk (idempotent update)
+                            # Prevents duplicate results when re-running map
+                            state.results = [
+                                r for r in state.results
+                                if r.chunk_id != chunk_result.chunk_id or r.status not in ("placeholder", "pending")
+                            ]
+                            state.results.append(chunk_result)
+                            batch_placeholders += 1
+                            placeholder_count += 1
+                            processed_count += 1  # Still count as processed for progress
+                        except Exception as e:
+                            print(f"[WARN] Failed to validate placeholder result: {e}")
+                            failed_count += 1
+                            batch_failed += 1
+                    else:
+                        # Add to state results (real analysis success)
+                        try:
+                            chunk_result = ChunkResult.model_validate(result)
+                            # HIGH-FIX: Remove ALL existing results for this chunk (idempotent update)
+                            # Real results should replace any prior result (placeholder, pending, OR failed)
+                            # This handles the --escalate retry scenario where failed → success
+                            # Without this, failed + success would coexist causing reduce phase confusion
+                            state.results = [
+                                r for r in state.results
+                                if r.chunk_id != chunk_result.chunk_id
+                            ]
+                            state.results.append(chunk_result)
+                            batch_success += 1
+                            processed_count += 1
+                            # P1-FIX: Emit chunk completion and findings
+                            progress_writer.emit_chunk_complete(
                                 chunk_result.chunk_id,
-                                finding.point[:100],
-                                finding.confidence
+                                len(chunk_result.findings),
+                                chunk_result.status  # P8-FIX: Use actual status instead of hardcoded "completed"
                             )
-                    except Exception as e:
-                        print(f"[WARN] Failed to validate result: {e}")
-                        failed_count += 1
-                        batch_failed += 1
-
-            # Update progress
-            completed = len(state.results)
-            state.progress_percent = (completed / len(state.chunks) * 100) if state.chunks else 0
-
-            # Save checkpoint after batch (with cancellation check)
-            checkpoint_mgr.save_checkpoint(state, batch_num, cancel_mgr=cancel_mgr)
-            manager.save()
-
-            # P1-FIX: Emit batch end event
-            progress_writer.emit_batch_end(batch_num, batch_success, batch_failed)
-
-            # MEDIUM-3 FIX: Include placeholder count in batch summary
-            if batch_placeholders > 0:
-                print(f"[MAP] Batch {batch_num}: {batch_success} success, {batch_placeholders} placeholders, {batch_failed} failed")
-            else:
-                print(f"[MAP] Batch {batch_num}: {batch_success} success, {batch_failed} failed")
-
-            # Phase 6: Check for cancellation after batch completion
-            if cancel_mgr and cancel_mgr.is_cancelled():
-                print("\n[CANCEL] Cancellation requested after batch, saving progress...")
-                cancelled = True
-                break
-
-            # Check for high failure rate (graceful degradation)
-            # Trigger on >50% failure rate (not just 100%)
-            failure_rate = batch_failed / len(batch_chunks) if batch_chunks else 0
-            if failure_rate > 0.5:
-                consecutive_failures += 1
-                if consecutive_failures >= 2 and sequential_fallback and not use_sequential:
-                    print("[WARN] 2 consecutive high-failure batches, switching to sequential")
-                    use_sequential = True
-                    consecutive_failures = 0  # Reset for sequential mode
-            else:
-                consecutive_failures = 0
+                            for finding in chunk_result.findings:
+                                # FIX: Use correct field names (point, confidence) from Finding model
+                                progress_writer.emit_finding(
+                                    chunk_result.chunk_id,
+                                    finding.point[:100],
+                                    finding.confidence
+                                )
+                        except Exception as e:
+                            print(f"[WARN] Failed to validate result: {e}")
+                            failed_count += 1
+                            batch_failed += 1
+
+                # Update progress
+                completed = len(state.results)
+                state.progress_percent = (completed / len(state.chunks) * 100) if state.chunks else 0
+
+                # Save checkpoint after batch (with cancellation check). The file write runs
+                # on a background thread; the next save, or the finally below, waits for it.
+                checkpoint_mgr.save_checkpoint(state, batch_num, cancel_mgr=cancel_mgr, background=True)
+                manager.save()
+
+                # P1-FIX: Emit batch end event
+                progress_writer.emit_batch_end(batch_num, batch_success, batch_failed)
+
+                # MEDIUM-3 FIX: Include placeholder count in batch summary
+                if batch_placeholders > 0:
+                    print(f"[MAP] Batch {batch_num}: {batch_success} success, {batch_placeholders} placeholders, {batch_failed} failed")
+                else:
+                    print(f"[MAP] Batch {batch_num}: {batch_success} success, {batch_failed} failed")
+
+                # Phase 6: Check for cancellation after batch completion
+                if cancel_mgr and cancel_mgr.is_cancelled():
+                    print("\n[CANCEL] Cancellation requested after batch, saving progress...")
+                    cancelled = True
+                    break
+
+                # Check for high failure rate (graceful degradation)
+                # Trigger on >50% failure rate (not just 100%)
+                failure_rate = batch_failed / len(batch_chunks) if batch_chunks else 0
+                if failure_rate > 0.5:
+                    consecutive_failures += 1
+                    if consecutive_failures >= 2 and sequential_fallback and not use_sequential:
+                        print("[WARN] 2 consecutive high-failure batches, switching to sequential")
+                        use_sequential = True
+                        consecutive_failures = 0  # Reset for sequential mode
+                else:
+                    consecutive_failures = 0
+        finally:
+            # Surface a failure of the last background save (logged, not raised)
+            checkpoint_mgr.wait_for_pending_write()
 
     # Phase 6: Final save on cancellation
     if cancelled:
@@ -23,6 +23,33 @@ from constants import (
 )
 
 
+def _compile_redos_patterns(patterns: list[str]) -> re.Pattern[str]:
+    """Combine ReDoS patterns into one alternation: a single search() per check.
+
+    Entries that do not compile are skipped, as the former per-pattern loop
+    did, rather than failing the import.
+
+    Args:
+        patterns: Regex patterns that flag a dangerous construct.
+
+    Returns:
+        Compiled pattern matching wherever any valid entry matches.
+    """
+    valid = []
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+        except re.error:
+            continue
+        valid.append(pattern)
+    if not valid:
+        return re.compile(r"(?!)")  # Never matches: nothing is flagged
+    return re.compile("|".join(f"(?:{pattern})" for pattern in valid))
+
+
+_REDOS_ANY = _compile_redos_patterns(REDOS_PATTERNS)
+
+
 def is_safe_regex(pattern: str) -> bool:
     """Check if regex pattern is potentially dangerous.
 
@@ -35,13 +62,7 @@ def is_safe_regex(pattern: str) -> bool:
     Returns:
         True if pattern appears safe, False if potentially dangerous.
     """
-    for danger_pattern in REDOS_PATTERNS:
-        try:
-            if re.search(danger_pattern, pattern):
-                return False
-        except re.error:
-            continue
-    return True
+    return _REDOS_ANY.search(pattern) is None
 
 
 def _grep_worker(
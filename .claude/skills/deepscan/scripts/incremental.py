@@ -50,12 +50,14 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TypedDict
 
 from pydantic import BaseModel, Field, ValidationError
 
+# pydantic only accepts typing.TypedDict on Python 3.12+; the project supports 3.10+
+from typing_extensions import TypedDict
+
 # Import SESSION_HASH_PATTERN from models (Single Source of Truth)
-from models import SESSION_HASH_PATTERN
+from models import DEFAULT_CACHE_ROOT, SESSION_HASH_PATTERN
 
 # P7-004: Optional xxhash import
 try:
@@ -452,7 +454,7 @@ class IncrementalAnalyzer:
             ValueError: If session_hash contains invalid characters.
         """
         # Validate session_hash to prevent path traversal attacks
-        if not SESSION_HASH_PATTERN.match(session_hash):
+        if not SESSION_HASH_PATTERN.fullmatch(session_hash):
             raise ValueError(
                 f"Invalid session_hash: '{session_hash}'. "
                 "Must contain only alphanumeric characters, underscores, and hyphens."
@@ -461,7 +463,7 @@ class IncrementalAnalyzer:
         self.session_hash = session_hash
 
         if cache_root is None:
-            cache_root = Path.home() / ".claude" / "cache" / "deepscan"
+            cache_root = DEFAULT_CACHE_ROOT
 
         self.cache_root = cache_root
         self.session_dir = cache_root / session_hash
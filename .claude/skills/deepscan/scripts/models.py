@@ -8,6 +8,7 @@ from __future__ import annotations
 __all__ = [
     # Constants
     "SESSION_HASH_PATTERN",
+    "DEFAULT_CACHE_ROOT",
     "MAX_CHECKPOINT_WRITE_SIZE",
     "MAX_CHECKPOINT_READ_SIZE",
     "MAX_CHECKPOINT_SIZE",
@@ -30,6 +31,7 @@ import secrets
 import time
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -39,9 +41,14 @@ from pydantic import BaseModel, Field
 # =============================================================================
 
 # Valid session hash pattern (alphanumeric, underscore, hyphen only)
-# Used by CheckpointManager and StateManager for path traversal prevention
+# Used by CheckpointManager and StateManager for path traversal prevention.
+# Check with fullmatch(): match() lets "$" accept a trailing newline.
 SESSION_HASH_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
+# Default root of per-session cache directories. Computed once here so every
+# module (checkpoint, incremental, ...) shares one definition of the location.
+DEFAULT_CACHE_ROOT = Path.home() / ".claude" / "cache" / "deepscan"
+
 # Checkpoint size limits (asymmetric for backward compatibility)
 # See DEEPSCAN_REVIEW_2026-01-21.md §2.1 for rationale.
 #
@@ -131,7 +138,14 @@ class Finding(BaseModel):
 
 
 class ChunkResult(BaseModel):
-    """Result from processing a single chunk."""
+    """Result from processing a single chunk.
+
+    Treat instances as immutable once added to DeepScanState.results: to update
+    a result, replace it with a new instance. CheckpointManager reuses the
+    serialized form of a result as long as the same object is still present,
+    so changing a field (or a list field's contents) in place would be missing
+    from later checkpoints.
+    """
 
     chunk_id: str
     status: str  # completed, partial, failed
@@ -230,7 +230,7 @@ def validate_session_hash(session_hash: str) -> bool:
     """
     if not session_hash:
         return False
-    if not SESSION_HASH_PATTERN.match(session_hash):
+    if not SESSION_HASH_PATTERN.fullmatch(session_hash):
         return False
     if ".." in session_hash or "/" in session_hash or "\\" in session_hash:
         return False
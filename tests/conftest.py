@@ -0,0 +1,89 @@
+"""Shared fixtures for DeepScan tests.
+
+The scripts directory is a flat module layout (no package), so it is put on
+sys.path here the same way deepscan_engine.py is run from the command line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / ".claude" / "skills" / "deepscan" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+class _FakeStateManager:
+    """Stands in for StateManager so cmd_exec runs without a session on disk."""
+
+    def __init__(self, session_hash: str):
+        self.session_hash = session_hash
+
+    @staticmethod
+    def get_current_session_hash() -> str:
+        return "deepscan_1_0123456789abcdef"
+
+    def load(self) -> None:
+        return None
+
+    def get_context(self) -> str:
+        return "sample context"
+
+
+class _FakeExecutor:
+    """Records code sent to the subprocess executor instead of running it."""
+
+    def __init__(self, calls: list[str]):
+        self._calls = calls
+
+    def execute(self, code: str) -> None:
+        self._calls.append(code)
+
+    def shutdown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def run_exec(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> Callable[[str], tuple[int, str, str | None]]:
+    """Run cmd_exec validation on a code snippet without executing it.
+
+    Returns:
+        Callable taking code and returning (exit code, stdout, execution path),
+        where the path is "subprocess", "main" (helper execution) or None when
+        the code was rejected before execution.
+    """
+    import deepscan_engine
+
+    calls: list[str] = []
+    main_calls: list[str] = []
+
+    def fake_thread_exec(code: str, namespace: dict, timeout: float) -> tuple[str, None]:
+        main_calls.append(code)
+        return "ok", None
+
+    monkeypatch.setattr(deepscan_engine, "StateManager", _FakeStateManager)
+    monkeypatch.setattr(
+        deepscan_engine,
+        "create_helpers",
+        lambda manager: {name: (lambda *a, **k: None) for name in deepscan_engine.HELPER_NAMES},
+    )
+    monkeypatch.setattr(
+        deepscan_engine, "get_repl_executor", lambda timeout=None: _FakeExecutor(calls)
+    )
+    monkeypatch.setattr(deepscan_engine, "_execute_with_thread_timeout", fake_thread_exec)
+
+    def run(code: str) -> tuple[int, str, str | None]:
+        calls.clear()
+        main_calls.clear()
+        rc = deepscan_engine.cmd_exec(argparse.Namespace(code=code, timeout=5))
+        out = capsys.readouterr().out
+        path = "main" if main_calls else "subprocess" if calls else None
+        return rc, out, path
+
+    return run
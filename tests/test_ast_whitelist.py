@@ -0,0 +1,131 @@
+"""Regression tests for the Layer 2 AST whitelist and Layer 3 attribute blocking.
+
+See docs/SECURITY.md (Layer 2: AST Node Whitelist, Layer 3: Dangerous Attributes).
+"""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+from deepscan_engine import ALLOWED_NODE_TYPES, DANGEROUS_ATTRS
+
+
+@pytest.mark.parametrize(
+    ("code", "node"),
+    [
+        ("def f():\n    pass", "FunctionDef"),
+        ("async def f():\n    pass", "AsyncFunctionDef"),
+        ("class A:\n    pass", "ClassDef"),
+        ("import json", "Import"),
+        ("from json import loads", "ImportFrom"),
+        ("global x", "Global"),
+        ("try:\n    x = 1\nexcept Exception:\n    pass", "Try"),
+        ("raise ValueError", "Raise"),
+        ("with x:\n    pass", "With"),
+        ("assert x", "Assert"),
+        ("while True:\n    pass", "While"),
+        ("x = lambda: (yield)", "Yield"),
+        ("match x:\n    case 1:\n        pass", "Match"),
+        ("x = [*y]", "Starred"),
+        ("x = y[1:2]", "Slice"),
+        ("(x := 1)", "NamedExpr"),
+    ],
+)
+def test_forbidden_node_rejected(run_exec, code, node):
+    rc, out, path = run_exec(code)
+
+    assert rc == 1
+    assert out == f"[ERROR] Forbidden AST node: {node}\n"
+    assert path is None
+
+
+@pytest.mark.parametrize(
+    ("code", "attr"),
+    [
+        ("x.__subclasses__()", "__subclasses__"),
+        ("x.__mro__", "__mro__"),
+        ("f.__code__", "__code__"),
+        ("x.__dict__", "__dict__"),
+        ('f"{x.__dict__}"', "__dict__"),
+        ("[y.__self__ for y in z]", "__self__"),
+        ("x.__builtins__", "__builtins__"),
+        ("x.__loader__", "__loader__"),
+        ("x._private", "_private"),
+        ("x.a._b", "_b"),
+    ],
+)
+def test_dangerous_attribute_rejected(run_exec, code, attr):
+    rc, out, path = run_exec(code)
+
+    assert rc == 1
+    assert out == f"[ERROR] Forbidden attribute: {attr}\n"
+    assert path is None
+
+
+def test_invalid_syntax_rejected(run_exec):
+    rc, out, path = run_exec("x = (")
+
+    assert rc == 1
+    assert out.startswith("[ERROR] Invalid Python syntax: ")
+    assert path is None
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "x = 1",
+        "len(content)",
+        "x = [a for a in range(3) if a]",
+        "d = {k: v for k, v in items}",
+        "f = lambda a: a + 1",
+        's = f"{content[0]}"',
+        "x = y if z else w",
+        "for a in b:\n    pass",
+        "content.upper()",
+    ],
+)
+def test_safe_code_runs_in_subprocess(run_exec, code):
+    rc, out, path = run_exec(code)
+
+    assert rc == 0
+    assert out == ""
+    assert path == "subprocess"
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["load_file('a.py')", "x = [grep('TODO') for _ in [1]]", "is_lazy_mode()"],
+)
+def test_helper_code_runs_in_main_process(run_exec, code):
+    rc, _, path = run_exec(code)
+
+    assert rc == 0
+    assert path == "main"
+
+
+def test_policy_sets_unchanged():
+    blocked = {
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.ClassDef,
+        ast.Import,
+        ast.ImportFrom,
+        ast.Global,
+        ast.Nonlocal,
+        ast.Yield,
+        ast.YieldFrom,
+        ast.Await,
+        ast.Try,
+        ast.Raise,
+        ast.With,
+        ast.Assert,
+        ast.Match,
+        ast.While,
+        ast.NamedExpr,
+        ast.Starred,
+    }
+    assert len(ALLOWED_NODE_TYPES) == 49
+    assert not blocked & ALLOWED_NODE_TYPES
+    assert len(DANGEROUS_ATTRS) == 19
+    assert all(attr.startswith("__") for attr in DANGEROUS_ATTRS)
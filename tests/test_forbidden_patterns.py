@@ -0,0 +1,109 @@
+"""Regression tests for the Layer 1 forbidden-pattern screen in cmd_exec.
+
+See docs/SECURITY.md (Layer 1: FORBIDDEN_PATTERNS).
+"""
+
+from __future__ import annotations
+
+import re
+
+import deepscan_engine
+import pytest
+from deepscan_engine import _FORBIDDEN_RE, FORBIDDEN_PATTERNS
+
+# Known escape vectors and the pattern each must be reported with. The report
+# names the first pattern in FORBIDDEN_PATTERNS order that matches anywhere.
+ESCAPE_VECTORS = [
+    ("__import__('os').system('id')", r"__import__"),
+    ("import os; os.system('id')", r"os\."),
+    ("eval(\"__import__('os')\")", r"__import__"),
+    ('exec("import os")', r"exec\s*\("),
+    ('exec ("x = 1")', r"exec\s*\("),
+    ('exec\n("x = 1")', r"exec\s*\("),
+    ("compile('1', 'f', 'eval')", r"compile\s*\("),
+    ("open('/etc/passwd').read()", r"open\s*\("),
+    ("subprocess", r"subprocess"),
+    ("sys.exit(0)", r"sys\."),
+    ("getattr(__builtins__, '__import__')('os')", r"__import__"),
+    ("getattr(content, 'upper')", r"getattr\s*\("),
+    ("setattr(content, 'x', 1)", r"setattr\s*\("),
+    ("delattr(content, 'x')", r"delattr\s*\("),
+    ("f.__globals__", r"__globals__"),
+    ("().__class__.__bases__[0].__subclasses__()", r"__class__"),
+    ("x.__bases__", r"__bases__"),
+    ("f.__closure__", r"__closure__"),
+    # Patterns inside strings, comments and f-strings are still rejected
+    ("x = '__import__'", r"__import__"),
+    ("x = 1  # os.system", r"os\."),
+    ("f\"{'__import__'}\"", r"__import__"),
+    # Several matches: the first listed pattern is reported, not the leftmost
+    ("os.getcwd(); __import__('sys')", r"__import__"),
+    ("sys.path; eval('1')", r"eval\s*\("),
+]
+
+
+def test_pattern_set_unchanged():
+    assert len(FORBIDDEN_PATTERNS) == 15
+    assert FORBIDDEN_PATTERNS[0] == r"__import__"
+    assert FORBIDDEN_PATTERNS[-1] == r"delattr\s*\("
+
+
+@pytest.mark.parametrize(("code", "pattern"), ESCAPE_VECTORS)
+def test_escape_vector_rejected(run_exec, code, pattern):
+    rc, out, path = run_exec(code)
+
+    assert rc == 1
+    assert out == f"[ERROR] Forbidden pattern detected: {pattern}\n"
+    assert path is None
+
+
+@pytest.mark.parametrize(("code", "pattern"), ESCAPE_VECTORS)
+def test_combined_regex_matches_pattern_loop(code, pattern):
+    first = next((p for p in FORBIDDEN_PATTERNS if re.search(p, code)), None)
+
+    assert first == pattern
+    assert _FORBIDDEN_RE.search(code) is not None
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "len(content)",
+        "x = [line for line in content.split('\\n') if line]",
+        "evaluate = 1",
+        "ops = posix",
+        "my_system = 'posix'",
+    ],
+)
+def test_clean_code_passes_screen(code):
+    assert _FORBIDDEN_RE.search(code) is None
+    assert not any(re.search(p, code) for p in FORBIDDEN_PATTERNS)
+
+
+def test_word_prefix_still_rejected(run_exec):
+    # Patterns are not anchored at word boundaries; keep it that way
+    rc, out, _ = run_exec("myexec(1)")
+
+    assert rc == 1
+    assert out == "[ERROR] Forbidden pattern detected: exec\\s*\\(\n"
+
+
+def test_code_too_long_rejected_before_session(run_exec, monkeypatch):
+    def no_session():
+        raise AssertionError("session must not be loaded for oversized code")
+
+    monkeypatch.setattr(deepscan_engine.StateManager, "get_current_session_hash", no_session)
+    code = "x = 1\n" * 20_000
+
+    rc, out, path = run_exec(code)
+
+    assert rc == 1
+    assert out == f"[ERROR] Code too long: {len(code)} bytes (max 100000)\n"
+    assert path is None
+
+
+def test_long_whitespace_run_is_linear():
+    # Worst case for the exec\s*\( family at the 100KB limit
+    code = "exec" + " " * 99_996
+
+    assert _FORBIDDEN_RE.search(code) is None
@@ -0,0 +1,74 @@
+"""Regression tests for the ReDoS pre-filter in grep_utils.is_safe_regex.
+
+See docs/SECURITY.md (Grep isolation).
+"""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from constants import REDOS_PATTERNS
+from grep_utils import _compile_redos_patterns, is_safe_regex
+
+# One dangerous pattern per REDOS_PATTERNS entry, in the same order
+DANGEROUS = [
+    r"(a+)+",
+    r"(a*)+",
+    r"(a+)*",
+    r"(a*)*",
+    r"(?:a+)+",
+    r"(?:a*)+",
+    r"(?P<word>a+)+",
+    r"(?P<word>a*)+",
+    r"(a|ab)+",
+    r"(a|ab)*",
+    r"([a-z]+)+",
+    r"(.*){3}",
+    r"(ab){2,}",
+]
+
+
+def test_pattern_set_unchanged():
+    assert len(REDOS_PATTERNS) == len(DANGEROUS) == 13
+
+
+@pytest.mark.parametrize(("pattern", "danger"), list(zip(DANGEROUS, REDOS_PATTERNS)))
+def test_dangerous_pattern_rejected(pattern, danger):
+    assert re.search(danger, pattern)
+    assert not is_safe_regex(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"TODO",
+        r"def \w+\(",
+        r"import (os|sys)",
+        r"\d{3}-\d{4}",
+        r"[A-Z][a-z]+Error",
+        r"(foo)?bar",
+        r"^class \w+:",
+        r"a+b*",
+    ],
+)
+def test_ordinary_pattern_accepted(pattern):
+    assert is_safe_regex(pattern)
+
+
+@pytest.mark.parametrize("pattern", [*DANGEROUS, r"TODO", r"(foo)?bar", r"x(y+)z"])
+def test_combined_regex_matches_pattern_loop(pattern):
+    flagged = any(re.search(danger, pattern) for danger in REDOS_PATTERNS)
+
+    assert is_safe_regex(pattern) is not flagged
+
+
+def test_invalid_entry_skipped():
+    combined = _compile_redos_patterns([r"(", r"\(a\+\)\+"])
+
+    assert combined.search(r"(a+)+")
+    assert combined.search(r"(b+)+") is None
+
+
+def test_no_valid_entries_flags_nothing():
+    assert _compile_redos_patterns([r"("]).search(r"(a+)+") is None